@@ -569,7 +569,7 @@ def init_git_repo(project_path: Path, quiet: bool = False) -> tuple[bool, str |
         quiet: if True suppress console output (tracker handles status)
 
     Returns:
-        Tuple of (success: bool, error_message: Optional[str])
+        Tuple of (success: bool, error_message: str | None)
     """
     try:
         original_cwd = Path.cwd()
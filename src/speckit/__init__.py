@@ -8,43 +8,108 @@ This library provides tools for the complete specification workflow:
 - Plan: Generate technical implementation plans
 - Tasks: Generate implementation task breakdowns
 - Analyze: Check consistency across artifacts
+
+Public names are resolved lazily (PEP 562): ``import speckit`` only defines
+this module, and LiteLLM, the Pydantic schemas and storage are imported the
+first time one of the exported names is accessed.
 """
 
-from speckit.config import LLMConfig, SpecKitConfig, StorageConfig
-from speckit.llm import LiteLLMProvider, LLMResponse
-from speckit.schemas import (
-    AnalysisReport,
-    APIContract,
-    APIEndpoint,
-    ArchitectureComponent,
-    ChecklistItem,
-    ClarificationQuestion,
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from speckit.config import LLMConfig, SpecKitConfig, StorageConfig
+    from speckit.llm import LiteLLMProvider, LLMResponse
+    from speckit.schemas import (
+        AnalysisReport,
+        APIContract,
+        APIEndpoint,
+        ArchitectureComponent,
+        ChecklistItem,
+        ClarificationQuestion,
+        Constitution,
+        DataModel,
+        DataModelEntity,
+        DataModelField,
+        Entity,
+        FeatureStatus,
+        FunctionalRequirement,
+        Phase,
+        PhaseType,
+        Priority,
+        QualityChecklist,
+        QuickstartGuide,
+        ResearchFindings,
+        Specification,
+        Task,
+        TaskBreakdown,
+        TaskStatus,
+        TechnicalPlan,
+        TechnologyDecision,
+        TechStack,
+        UserStory,
+    )
+    from speckit.speckit import SpecKit
+
+# Exported name -> defining module
+_LAZY_IMPORTS: dict[str, str] = {
+    # Main class
+    "SpecKit": "speckit.speckit",
+    # Config
+    "LLMConfig": "speckit.config",
+    "StorageConfig": "speckit.config",
+    "SpecKitConfig": "speckit.config",
+    # LLM
+    "LiteLLMProvider": "speckit.llm",
+    "LLMResponse": "speckit.llm",
+    # Enums
+    "Priority": "speckit.schemas",
+    "TaskStatus": "speckit.schemas",
+    "PhaseType": "speckit.schemas",
+    "FeatureStatus": "speckit.schemas",
     # Workflow artifacts
-    Constitution,
+    "Constitution": "speckit.schemas",
+    "UserStory": "speckit.schemas",
+    "FunctionalRequirement": "speckit.schemas",
+    "Entity": "speckit.schemas",
+    "Specification": "speckit.schemas",
+    "TechStack": "speckit.schemas",
+    "ArchitectureComponent": "speckit.schemas",
+    "TechnicalPlan": "speckit.schemas",
+    "Phase": "speckit.schemas",
+    "Task": "speckit.schemas",
+    "TaskBreakdown": "speckit.schemas",
+    "ClarificationQuestion": "speckit.schemas",
+    "AnalysisReport": "speckit.schemas",
     # Extended artifacts
-    DataModel,
-    DataModelEntity,
-    DataModelField,
-    Entity,
-    FeatureStatus,
-    FunctionalRequirement,
-    Phase,
-    PhaseType,
-    # Enums
-    Priority,
-    QualityChecklist,
-    QuickstartGuide,
-    ResearchFindings,
-    Specification,
-    Task,
-    TaskBreakdown,
-    TaskStatus,
-    TechnicalPlan,
-    TechnologyDecision,
-    TechStack,
-    UserStory,
-)
-from speckit.speckit import SpecKit
+    "DataModel": "speckit.schemas",
+    "DataModelEntity": "speckit.schemas",
+    "DataModelField": "speckit.schemas",
+    "ResearchFindings": "speckit.schemas",
+    "TechnologyDecision": "speckit.schemas",
+    "APIContract": "speckit.schemas",
+    "APIEndpoint": "speckit.schemas",
+    "QualityChecklist": "speckit.schemas",
+    "ChecklistItem": "speckit.schemas",
+    "QuickstartGuide": "speckit.schemas",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import exported names on first access and cache them on the module."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include lazily exported names in ``dir(speckit)``."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __version__ = "0.2.4"
 __all__ = [
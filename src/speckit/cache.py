@@ -0,0 +1,335 @@
+"""
+Response caches for LLM calls.
+
+This module provides:
+- CacheBackend: Protocol for cache storage backends
+- MemoryCacheBackend: In-process dictionary backend
+- FileCacheBackend: JSON files under a cache directory (e.g. .speckit/cache/)
+- LLMCache: Request-keyed cache with TTL and hit/miss statistics
+- SemanticCache: Embedding-similarity cache for near-duplicate inputs
+
+LLMCache entries are keyed by the SHA-256 of the canonical JSON form of the
+request (model, messages, sampling parameters and response model), so
+identical requests map to the same entry across runs.
+
+Cache directories are created with a .gitignore ignoring their contents, and
+can be deleted at any time to clear the cache.
+"""
+
+import contextlib
+import hashlib
+import json
+import logging
+import math
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Protocol
+
+logger = logging.getLogger(__name__)
+
+
+def _ensure_cache_dir(cache_dir: Path) -> None:
+    """Create a cache directory that git ignores, since .speckit/ is usually committed."""
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    gitignore = cache_dir / ".gitignore"
+    if not gitignore.exists():
+        gitignore.write_text("*\n", encoding="utf-8")
+
+
+class CacheBackend(Protocol):
+    """Storage backend for cached LLM responses."""
+
+    def get(self, key: str) -> dict | None:
+        """Get a stored entry, or None if absent."""
+        ...
+
+    def set(self, key: str, entry: dict) -> None:
+        """Store an entry under a key."""
+        ...
+
+
+class MemoryCacheBackend:
+    """Cache backend keeping entries in a process-local dictionary."""
+
+    def __init__(self):
+        """Initialize an empty in-memory backend."""
+        self._entries: dict[str, dict] = {}
+
+    def get(self, key: str) -> dict | None:
+        """Get a stored entry, or None if absent."""
+        return self._entries.get(key)
+
+    def set(self, key: str, entry: dict) -> None:
+        """Store an entry under a key."""
+        self._entries[key] = entry
+
+
+class FileCacheBackend:
+    """Cache backend storing one JSON file per entry."""
+
+    def __init__(self, cache_dir: str | Path):
+        """
+        Initialize file backend.
+
+        Args:
+            cache_dir: Directory for cache files (created on first write)
+        """
+        self.cache_dir = Path(cache_dir)
+
+    def _entry_path(self, key: str) -> Path:
+        """Get the file path for a cache key."""
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> dict | None:
+        """Get a stored entry, or None if absent or unreadable."""
+        try:
+            return json.loads(self._entry_path(key).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def set(self, key: str, entry: dict) -> None:
+        """
+        Store an entry under a key, replacing any previous file atomically.
+
+        Caching is best-effort: a write that fails (e.g. an unwritable cache
+        directory) is logged and the entry is dropped.
+        """
+        file_path = self._entry_path(key)
+        tmp_path = file_path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            _ensure_cache_dir(self.cache_dir)
+            tmp_path.write_text(json.dumps(entry), encoding="utf-8")
+            os.replace(tmp_path, file_path)
+        except OSError as e:
+            logger.warning("Could not write cache entry %s: %s", file_path, e)
+            with contextlib.suppress(OSError):
+                tmp_path.unlink(missing_ok=True)
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for a cache."""
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Get the fraction of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class LLMCache:
+    """
+    Cache for LLM responses keyed by request content.
+
+    Example:
+        >>> cache = LLMCache(FileCacheBackend(".speckit/cache"))
+        >>> provider = LiteLLMProvider(LLMConfig(temperature=0), cache=cache)
+    """
+
+    def __init__(self, backend: CacheBackend, ttl_seconds: float | None = None):
+        """
+        Initialize cache.
+
+        Args:
+            backend: Storage backend for entries
+            ttl_seconds: Maximum entry age; None keeps entries indefinitely
+        """
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.stats = CacheStats()
+
+    @staticmethod
+    def make_key(request: dict) -> str:
+        """Build the cache key for a request payload."""
+        canonical = json.dumps(request, sort_keys=True, default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def get(self, request: dict) -> Any | None:
+        """
+        Look up the cached value for a request.
+
+        Args:
+            request: JSON-serializable request payload
+
+        Returns:
+            Cached value, or None on a miss, expired or malformed entry
+        """
+        entry = self.backend.get(self.make_key(request))
+        if not isinstance(entry, dict) or "value" not in entry:
+            # Absent, or written in a format this version does not understand
+            entry = None
+        elif self.ttl_seconds is not None:
+            created_at = entry.get("created_at")
+            if not isinstance(created_at, int | float) or (
+                time.time() - created_at > self.ttl_seconds
+            ):
+                entry = None
+
+        if entry is None:
+            self.stats.misses += 1
+            return None
+
+        self.stats.hits += 1
+        return entry["value"]
+
+    def set(self, request: dict, value: Any) -> None:
+        """
+        Store the value for a request.
+
+        Args:
+            request: JSON-serializable request payload
+            value: JSON-serializable response value
+        """
+        self.backend.set(self.make_key(request), {"created_at": time.time(), "value": value})
+
+
+class SemanticCache:
+    """
+    Cache that matches inputs by embedding similarity.
+
+    Entries hold the normalized input text, its unit-length embedding and the
+    cached value, grouped by a scope string (e.g. model, language and other
+    prompt context). Lookups try an exact text match first, which needs no
+    embedding, then fall back to cosine similarity against the scope's entries.
+
+    Example:
+        >>> cache = SemanticCache(threshold=0.92, path=".speckit/cache/semantic.json")
+        >>> value = cache.get_exact(text, scope)
+        >>> if value is None:
+        ...     vector = provider.embed(text)
+        ...     value = cache.get_similar(vector, scope)
+    """
+
+    # Keys every persisted entry must have
+    _ENTRY_KEYS = frozenset({"scope", "text", "vector", "value"})
+
+    def __init__(self, threshold: float = 0.92, path: str | Path | None = None):
+        """
+        Initialize semantic cache.
+
+        Args:
+            threshold: Minimum cosine similarity for a match
+            path: Optional JSON file to persist entries across runs
+        """
+        self.threshold = threshold
+        self.path = Path(path) if path is not None else None
+        self.stats = CacheStats()
+        self._entries: list[dict] | None = None
+
+    @staticmethod
+    def normalize_text(text: str) -> str:
+        """Normalize whitespace and case for exact matching."""
+        return " ".join(text.lower().split())
+
+    @staticmethod
+    def _unit(vector: list[float]) -> list[float]:
+        """Scale a vector to unit length."""
+        norm = math.sqrt(sum(x * x for x in vector))
+        return [x / norm for x in vector] if norm else list(vector)
+
+    @property
+    def entries(self) -> list[dict]:
+        """Get cached entries, loading them from disk on first access."""
+        if self._entries is None:
+            self._entries = self._read_entries()
+        return self._entries
+
+    def _read_entries(self) -> list[dict]:
+        """Read persisted entries, skipping unreadable files and malformed entries."""
+        if self.path is None:
+            return []
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return []
+        if not isinstance(data, list):
+            return []
+        return [
+            entry for entry in data if isinstance(entry, dict) and entry.keys() >= self._ENTRY_KEYS
+        ]
+
+    def get_exact(self, text: str, scope: str) -> Any | None:
+        """Get the value cached for the same normalized text, without counting a miss."""
+        normalized = self.normalize_text(text)
+        for entry in self.entries:
+            if entry["scope"] == scope and entry["text"] == normalized:
+                self.stats.hits += 1
+                return entry["value"]
+        return None
+
+    def get_similar(self, vector: list[float], scope: str) -> Any | None:
+        """
+        Get the value of the most similar entry above the threshold.
+
+        Args:
+            vector: Embedding of the input
+            scope: Scope the entry must belong to
+
+        Returns:
+            Cached value, or None if no entry is similar enough
+        """
+        unit = self._unit(vector)
+        best_value, best_score = None, self.threshold
+        for entry in self.entries:
+            if entry["scope"] != scope or len(entry["vector"]) != len(unit):
+                continue
+            score = sum(a * b for a, b in zip(unit, entry["vector"], strict=True))
+            if score >= best_score:
+                best_value, best_score = entry["value"], score
+
+        if best_value is None:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+        return best_value
+
+    def add(self, text: str, vector: list[float], scope: str, value: Any) -> None:
+        """
+        Store a value for an input.
+
+        Persisting to disk is best-effort: if the cache file cannot be written
+        the entry is kept in memory only.
+
+        Args:
+            text: Input text
+            vector: Embedding of the input
+            scope: Scope of the entry
+            value: JSON-serializable value
+        """
+        self.entries.append(
+            {
+                "scope": scope,
+                "text": self.normalize_text(text),
+                "vector": self._unit(vector),
+                "value": value,
+            }
+        )
+        if self.path is not None:
+            self._write_entries()
+
+    def _write_entries(self) -> None:
+        """Persist entries atomically; failures are logged and the file is left as is."""
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            _ensure_cache_dir(self.path.parent)
+            tmp_path.write_text(json.dumps(self.entries), encoding="utf-8")
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning("Could not write semantic cache %s: %s", self.path, e)
+            with contextlib.suppress(OSError):
+                tmp_path.unlink(missing_ok=True)
+
+
+__all__ = [
+    "CacheBackend",
+    "CacheStats",
+    "FileCacheBackend",
+    "LLMCache",
+    "MemoryCacheBackend",
+    "SemanticCache",
+]
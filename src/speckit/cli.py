@@ -14,15 +14,15 @@ Usage:
 import json
 from enum import StrEnum
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
 from rich.console import Console
-from rich.markdown import Markdown
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
 
-from speckit.speckit import SpecKit
+if TYPE_CHECKING:
+    from rich.table import Table
+
+    from speckit.speckit import SpecKit
 
 # Create Typer app
 app = typer.Typer(
@@ -56,8 +56,16 @@ class GlobalOptions:
 _global_opts = GlobalOptions()
 
 
-def get_kit() -> SpecKit:
-    """Get SpecKit instance with current configuration."""
+def get_kit() -> "SpecKit":
+    """
+    Get SpecKit instance with current configuration.
+
+    SpecKit (and with it LiteLLM and the schema models) is imported here rather
+    than at module level so that ``--help`` and argument errors stay fast; only
+    a command that actually runs pays for the import.
+    """
+    from speckit.speckit import SpecKit
+
     return SpecKit(_global_opts.project_path)
 
 
@@ -72,6 +80,8 @@ def output(content: str, format_type: OutputFormat | None = None) -> None:
     else:
         # Rich format - render markdown
         if content.startswith("#") or "**" in content:
+            from rich.markdown import Markdown
+
             console.print(Markdown(content))
         else:
             console.print(content)
@@ -83,9 +93,31 @@ def output_json(data: dict) -> None:
         console.print_json(json.dumps(data, indent=2, default=str))
 
 
+# Column schemas for tabular output: (header, style)
+_CONFIG_COLUMNS = (("Setting", "cyan"), ("Value", None))
+_FEATURE_COLUMNS = (
+    ("Feature ID", "cyan"),
+    ("Has Spec", None),
+    ("Has Plan", None),
+    ("Has Tasks", None),
+)
+
+
+def make_table(title: str, columns: tuple[tuple[str, str | None], ...]) -> "Table":
+    """Create a Rich table with the given column schema."""
+    from rich.table import Table
+
+    table = Table(title=title)
+    for header, style in columns:
+        table.add_column(header, style=style)
+    return table
+
+
 def progress_context(description: str):
     """Create a progress context for LLM operations."""
     if _global_opts.format == OutputFormat.RICH:
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+
         return Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -154,6 +186,8 @@ def init(
     kit.config.save()
 
     if _global_opts.format == OutputFormat.RICH:
+        from rich.panel import Panel
+
         console.print(
             Panel.fit(
                 f"[green]Project initialized:[/green] {project_name}\n\n"
@@ -452,9 +486,7 @@ def config_show():
             }
         )
     else:
-        table = Table(title="Configuration")
-        table.add_column("Setting", style="cyan")
-        table.add_column("Value")
+        table = make_table("Configuration", _CONFIG_COLUMNS)
 
         table.add_row("Model", config.llm.model)
         table.add_row("Temperature", str(config.llm.temperature))
@@ -560,16 +592,13 @@ def list_features():
     elif not features:
         console.print("[dim]No features found.[/dim]")
     else:
-        table = Table(title="Features")
-        table.add_column("Feature ID", style="cyan")
-        table.add_column("Has Spec")
-        table.add_column("Has Plan")
-        table.add_column("Has Tasks")
+        table = make_table("Features", _FEATURE_COLUMNS)
 
         for feature_id in features:
-            has_spec = "Yes" if kit.storage.artifact_exists(feature_id, "spec") else "-"
-            has_plan = "Yes" if kit.storage.artifact_exists(feature_id, "plan") else "-"
-            has_tasks = "Yes" if kit.storage.artifact_exists(feature_id, "tasks") else "-"
+            artifacts = kit.storage.list_artifacts(feature_id)
+            has_spec = "Yes" if "spec" in artifacts else "-"
+            has_plan = "Yes" if "plan" in artifacts else "-"
+            has_tasks = "Yes" if "tasks" in artifacts else "-"
             table.add_row(feature_id, has_spec, has_plan, has_tasks)
 
         console.print(table)
@@ -11,6 +11,8 @@ Configuration precedence (highest to lowest):
 4. Default values
 """
 
+import hashlib
+import os
 from pathlib import Path
 from typing import Literal
 
@@ -35,10 +37,26 @@ class LLMConfig(BaseSettings):
     max_tokens: int = Field(default=4096, gt=0, description="Maximum tokens in response")
     timeout: int = Field(default=120, gt=0, description="Request timeout in seconds")
     max_retries: int = Field(default=3, ge=0, description="Maximum retry attempts")
+    max_concurrency: int = Field(
+        default=5, ge=1, description="Maximum simultaneous requests for batch generation"
+    )
     fallback_models: list[str] = Field(
         default_factory=lambda: ["gpt-4o-mini", "claude-3-haiku-20240307"],
         description="Fallback models to try on failure",
     )
+    cache_responses: bool = Field(
+        default=True,
+        description="Cache responses of deterministic (temperature 0) calls in .speckit/cache",
+    )
+    embedding_model: str = Field(
+        default="text-embedding-3-small", description="LiteLLM embedding model identifier"
+    )
+    semantic_cache_threshold: float | None = Field(
+        default=None,
+        gt=0.0,
+        le=1.0,
+        description="Reuse specifications for descriptions at least this similar (off if unset)",
+    )
 
     def to_dict(self) -> dict:
         """Convert to dictionary for LiteLLM."""
@@ -68,6 +86,29 @@ class StorageConfig(BaseSettings):
     specs_dir: str = Field(default="specs", description="Feature specifications directory")
 
 
+def _file_signature(path: Path) -> tuple[int, int] | None:
+    """Get (mtime_ns, size) of a file, or None if it does not exist."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _environment_signature() -> tuple:
+    """Fingerprint the environment inputs of the settings models."""
+    env = "\0".join(sorted(f"{k}={v}" for k, v in os.environ.items() if k.startswith("SPECKIT_")))
+    return (
+        hashlib.sha256(env.encode("utf-8")).hexdigest(),
+        Path.cwd(),
+        _file_signature(Path(".env")),
+    )
+
+
+# Resolved project configs: (class, project path) -> (input signature, config)
+_PROJECT_CONFIG_CACHE: dict[tuple[type, Path], tuple[tuple, "SpecKitConfig"]] = {}
+
+
 class SpecKitConfig(BaseSettings):
     """Main configuration container."""
 
@@ -90,10 +131,25 @@ class SpecKitConfig(BaseSettings):
 
         Looks for .speckit/config.yaml in the project directory.
         Falls back to environment variables and defaults if not found.
+        The result is memoized per process until the config file or the
+        SPECKIT_* environment changes; each call returns its own copy.
         """
         project_path = Path(project_path).resolve()
         config_file = project_path / ".speckit" / "config.yaml"
 
+        # Reuse the resolved config while the file and environment are unchanged
+        signature = (_file_signature(config_file), _environment_signature())
+        cached = _PROJECT_CONFIG_CACHE.get((cls, project_path))
+        if cached is not None and cached[0] == signature:
+            return cached[1].model_copy(deep=True)
+
+        config = cls._load_project(project_path, config_file)
+        _PROJECT_CONFIG_CACHE[cls, project_path] = (signature, config.model_copy(deep=True))
+        return config
+
+    @classmethod
+    def _load_project(cls, project_path: Path, config_file: Path) -> "SpecKitConfig":
+        """Build the configuration from the config file, environment and defaults."""
         config_data: dict = {"project_path": project_path}
 
         if config_file.exists():
@@ -134,7 +190,11 @@ class SpecKitConfig(BaseSettings):
                 "max_tokens": self.llm.max_tokens,
                 "timeout": self.llm.timeout,
                 "max_retries": self.llm.max_retries,
+                "max_concurrency": self.llm.max_concurrency,
                 "fallback_models": self.llm.fallback_models,
+                "cache_responses": self.llm.cache_responses,
+                "embedding_model": self.llm.embedding_model,
+                "semantic_cache_threshold": self.llm.semantic_cache_threshold,
             },
             "storage": {
                 "backend": self.storage.backend,
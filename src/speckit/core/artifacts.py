@@ -6,9 +6,17 @@ the core workflow: data models, research findings, API contracts,
 quality checklists, and quickstart guides.
 """
 
+import asyncio
+import functools
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from datetime import datetime
 
-from speckit.llm import LiteLLMProvider
+from pydantic import BaseModel
+
+from speckit.llm import LiteLLMProvider, ProgressCallback
 from speckit.schemas import (
     APIContract,
     DataModel,
@@ -22,6 +30,69 @@ from speckit.storage.base import StorageBase
 from speckit.templates import render_template
 
 
+@dataclass(frozen=True)
+class _ArtifactKind:
+    """Prompt template, output model and system prompt for one artifact type."""
+
+    template: str
+    response_model: type[BaseModel]
+    system: str
+
+
+_ARTIFACT_KINDS: dict[str, _ArtifactKind] = {
+    "data_model": _ArtifactKind(
+        template="data_model.jinja2",
+        response_model=DataModel,
+        system="You are a database architect creating data model specifications.",
+    ),
+    "research": _ArtifactKind(
+        template="research.jinja2",
+        response_model=ResearchFindings,
+        system="You are a technology researcher documenting architectural decisions.",
+    ),
+    "api_contract": _ArtifactKind(
+        template="api_contract.jinja2",
+        response_model=APIContract,
+        system="You are an API architect creating formal API specifications.",
+    ),
+    "checklist": _ArtifactKind(
+        template="checklist.jinja2",
+        response_model=QualityChecklist,
+        system="You are a quality assurance specialist validating specification quality.",
+    ),
+    "quickstart": _ArtifactKind(
+        template="quickstart.jinja2",
+        response_model=QuickstartGuide,
+        system="You are a technical writer creating developer onboarding documentation.",
+    ),
+}
+
+
+@dataclass
+class _Batch:
+    """Serialized inputs and shared timestamp for one batch() block."""
+
+    created_at: datetime
+    dumps: dict[int, tuple[BaseModel, str]] = field(default_factory=dict)
+
+
+# Open batch of the current thread or asyncio task. Tasks get their own copy
+# of the context, so concurrent generate_all_async() calls never see each
+# other's batch; nested batches (even across generators) share the outer one
+_BATCH: ContextVar[_Batch | None] = ContextVar("speckit_artifact_batch", default=None)
+
+
+@dataclass
+class ExtendedArtifacts:
+    """All extended artifacts generated for one feature."""
+
+    data_model: DataModel
+    research: ResearchFindings
+    api_contract: APIContract
+    checklist: QualityChecklist
+    quickstart: QuickstartGuide
+
+
 class ArtifactGenerator:
     """
     Generates extended artifacts for feature development.
@@ -34,6 +105,8 @@ class ArtifactGenerator:
     - Quickstart guides (developer onboarding)
     """
 
+    __slots__ = ("llm", "storage")
+
     def __init__(self, llm: LiteLLMProvider, storage: StorageBase):
         """
         Initialize artifact generator.
@@ -45,6 +118,114 @@ class ArtifactGenerator:
         self.llm = llm
         self.storage = storage
 
+    @contextmanager
+    def batch(self) -> Iterator["ArtifactGenerator"]:
+        """
+        Share per-input work across several generate_* calls.
+
+        Inside the block each specification/plan is serialized for the prompt
+        only once, and all generated artifacts get the same created_at
+        timestamp. Inputs must not be mutated while the batch is open.
+
+        Example:
+            >>> with generator.batch():
+            ...     data_model = generator.generate_data_model(spec, plan)
+            ...     contract = generator.generate_api_contract(spec, plan)
+        """
+        if _BATCH.get() is not None:
+            # Nested batch: reuse the outer one
+            yield self
+            return
+
+        token = _BATCH.set(_Batch(created_at=datetime.now()))
+        try:
+            yield self
+        finally:
+            _BATCH.reset(token)
+
+    def _dump(self, model: BaseModel) -> str:
+        """Serialize a model to prompt JSON, memoized inside batch()."""
+        batch = _BATCH.get()
+        if batch is None:
+            return model.model_dump_json(indent=2)
+
+        # Keep a reference to the model so its id() cannot be reused
+        cached = batch.dumps.get(id(model))
+        if cached is None:
+            cached = batch.dumps[id(model)] = (model, model.model_dump_json(indent=2))
+        return cached[1]
+
+    def _now(self) -> datetime:
+        """Get the creation timestamp for a generated artifact."""
+        batch = _BATCH.get()
+        return batch.created_at if batch is not None else datetime.now()
+
+    # =========================================================================
+    # Generic Generation
+    # =========================================================================
+
+    def _prepare(
+        self,
+        kind: str,
+        specification: Specification | None,
+        plan: TechnicalPlan | None,
+        language: str | None,
+    ) -> dict:
+        """Build the structured-completion arguments for an artifact kind."""
+        artifact_kind = _ARTIFACT_KINDS[kind]
+        context = {"specification": specification, "plan": plan}
+        if specification is not None:
+            context["specification_json"] = self._dump(specification)
+        if plan is not None:
+            context["plan_json"] = self._dump(plan)
+
+        return {
+            "prompt": render_template(artifact_kind.template, **context, language=language),
+            "response_model": artifact_kind.response_model,
+            "system": artifact_kind.system,
+        }
+
+    def _generate(
+        self,
+        kind: str,
+        specification: Specification | None = None,
+        plan: TechnicalPlan | None = None,
+        language: str | None = None,
+    ) -> BaseModel:
+        """Render the prompt for an artifact kind and generate it with the LLM."""
+        request = self._prepare(kind, specification, plan, language)
+        artifact = self.llm.complete_structured(**request)
+        return self._stamp(artifact, specification, plan)
+
+    async def _generate_async(
+        self,
+        kind: str,
+        specification: Specification | None = None,
+        plan: TechnicalPlan | None = None,
+        language: str | None = None,
+        on_progress: ProgressCallback | None = None,
+    ) -> BaseModel:
+        """Async version of _generate(), optionally reporting partial artifacts."""
+        request = self._prepare(kind, specification, plan, language)
+        artifact = await self.llm.complete_structured_async(**request, on_progress=on_progress)
+        return self._stamp(artifact, specification, plan)
+
+    def _stamp(
+        self,
+        artifact: BaseModel,
+        specification: Specification | None,
+        plan: TechnicalPlan | None,
+    ) -> BaseModel:
+        """Overwrite LLM-provided IDs with the ones from the source artifacts."""
+        if specification is not None:
+            artifact.feature_id = specification.feature_id
+            artifact.feature_name = specification.feature_name
+        else:
+            artifact.feature_id = plan.feature_id
+        artifact.created_at = self._now()
+
+        return artifact
+
     # =========================================================================
     # Data Model Generation
     # =========================================================================
@@ -66,52 +247,29 @@ class ArtifactGenerator:
         Returns:
             Generated DataModel with entities and fields
         """
-        prompt = render_template(
-            "data_model.jinja2",
-            specification=specification.model_dump(mode="json"),
-            plan=plan.model_dump(mode="json"),
+        return self._generate(
+            "data_model",
+            specification=specification,
+            plan=plan,
             language=language,
         )
 
-        data_model = self.llm.complete_structured(
-            prompt=prompt,
-            response_model=DataModel,
-            system="You are a database architect creating data model specifications.",
-        )
-
-        # Ensure IDs are set correctly
-        data_model.feature_id = specification.feature_id
-        data_model.feature_name = specification.feature_name
-        data_model.created_at = datetime.now()
-
-        return data_model
-
     async def generate_data_model_async(
         self,
         specification: Specification,
         plan: TechnicalPlan,
         language: str | None = None,
+        on_progress: ProgressCallback | None = None,
     ) -> DataModel:
         """Async version of generate_data_model()."""
-        prompt = render_template(
-            "data_model.jinja2",
-            specification=specification.model_dump(mode="json"),
-            plan=plan.model_dump(mode="json"),
+        return await self._generate_async(
+            "data_model",
+            specification=specification,
+            plan=plan,
             language=language,
+            on_progress=on_progress,
         )
 
-        data_model = await self.llm.complete_structured_async(
-            prompt=prompt,
-            response_model=DataModel,
-            system="You are a database architect creating data model specifications.",
-        )
-
-        data_model.feature_id = specification.feature_id
-        data_model.feature_name = specification.feature_name
-        data_model.created_at = datetime.now()
-
-        return data_model
-
     # =========================================================================
     # Research Findings Generation
     # =========================================================================
@@ -131,47 +289,26 @@ class ArtifactGenerator:
         Returns:
             Generated ResearchFindings with technology decisions
         """
-        prompt = render_template(
-            "research.jinja2",
-            plan=plan.model_dump(mode="json"),
+        return self._generate(
+            "research",
+            plan=plan,
             language=language,
         )
 
-        research = self.llm.complete_structured(
-            prompt=prompt,
-            response_model=ResearchFindings,
-            system="You are a technology researcher documenting architectural decisions.",
-        )
-
-        # Ensure IDs are set correctly
-        research.feature_id = plan.feature_id
-        research.created_at = datetime.now()
-
-        return research
-
     async def generate_research_async(
         self,
         plan: TechnicalPlan,
         language: str | None = None,
+        on_progress: ProgressCallback | None = None,
     ) -> ResearchFindings:
         """Async version of generate_research()."""
-        prompt = render_template(
-            "research.jinja2",
-            plan=plan.model_dump(mode="json"),
+        return await self._generate_async(
+            "research",
+            plan=plan,
             language=language,
+            on_progress=on_progress,
         )
 
-        research = await self.llm.complete_structured_async(
-            prompt=prompt,
-            response_model=ResearchFindings,
-            system="You are a technology researcher documenting architectural decisions.",
-        )
-
-        research.feature_id = plan.feature_id
-        research.created_at = datetime.now()
-
-        return research
-
     # =========================================================================
     # API Contract Generation
     # =========================================================================
@@ -193,52 +330,29 @@ class ArtifactGenerator:
         Returns:
             Generated APIContract with endpoint definitions
         """
-        prompt = render_template(
-            "api_contract.jinja2",
-            specification=specification.model_dump(mode="json"),
-            plan=plan.model_dump(mode="json"),
+        return self._generate(
+            "api_contract",
+            specification=specification,
+            plan=plan,
             language=language,
         )
 
-        contract = self.llm.complete_structured(
-            prompt=prompt,
-            response_model=APIContract,
-            system="You are an API architect creating formal API specifications.",
-        )
-
-        # Ensure IDs are set correctly
-        contract.feature_id = specification.feature_id
-        contract.feature_name = specification.feature_name
-        contract.created_at = datetime.now()
-
-        return contract
-
     async def generate_api_contract_async(
         self,
         specification: Specification,
         plan: TechnicalPlan,
         language: str | None = None,
+        on_progress: ProgressCallback | None = None,
     ) -> APIContract:
         """Async version of generate_api_contract()."""
-        prompt = render_template(
-            "api_contract.jinja2",
-            specification=specification.model_dump(mode="json"),
-            plan=plan.model_dump(mode="json"),
+        return await self._generate_async(
+            "api_contract",
+            specification=specification,
+            plan=plan,
             language=language,
+            on_progress=on_progress,
         )
 
-        contract = await self.llm.complete_structured_async(
-            prompt=prompt,
-            response_model=APIContract,
-            system="You are an API architect creating formal API specifications.",
-        )
-
-        contract.feature_id = specification.feature_id
-        contract.feature_name = specification.feature_name
-        contract.created_at = datetime.now()
-
-        return contract
-
     # =========================================================================
     # Quality Checklist Generation
     # =========================================================================
@@ -258,49 +372,26 @@ class ArtifactGenerator:
         Returns:
             Generated QualityChecklist with validation items
         """
-        prompt = render_template(
-            "checklist.jinja2",
-            specification=specification.model_dump(mode="json"),
+        return self._generate(
+            "checklist",
+            specification=specification,
             language=language,
         )
 
-        checklist = self.llm.complete_structured(
-            prompt=prompt,
-            response_model=QualityChecklist,
-            system="You are a quality assurance specialist validating specification quality.",
-        )
-
-        # Ensure IDs are set correctly
-        checklist.feature_id = specification.feature_id
-        checklist.feature_name = specification.feature_name
-        checklist.created_at = datetime.now()
-
-        return checklist
-
     async def generate_checklist_async(
         self,
         specification: Specification,
         language: str | None = None,
+        on_progress: ProgressCallback | None = None,
     ) -> QualityChecklist:
         """Async version of generate_checklist()."""
-        prompt = render_template(
-            "checklist.jinja2",
-            specification=specification.model_dump(mode="json"),
+        return await self._generate_async(
+            "checklist",
+            specification=specification,
             language=language,
+            on_progress=on_progress,
         )
 
-        checklist = await self.llm.complete_structured_async(
-            prompt=prompt,
-            response_model=QualityChecklist,
-            system="You are a quality assurance specialist validating specification quality.",
-        )
-
-        checklist.feature_id = specification.feature_id
-        checklist.feature_name = specification.feature_name
-        checklist.created_at = datetime.now()
-
-        return checklist
-
     # =========================================================================
     # Quickstart Guide Generation
     # =========================================================================
@@ -322,48 +413,112 @@ class ArtifactGenerator:
         Returns:
             Generated QuickstartGuide with setup instructions
         """
-        prompt = render_template(
-            "quickstart.jinja2",
-            specification=specification.model_dump(mode="json"),
-            plan=plan.model_dump(mode="json"),
+        return self._generate(
+            "quickstart",
+            specification=specification,
+            plan=plan,
             language=language,
         )
 
-        quickstart = self.llm.complete_structured(
-            prompt=prompt,
-            response_model=QuickstartGuide,
-            system="You are a technical writer creating developer onboarding documentation.",
-        )
-
-        # Ensure IDs are set correctly
-        quickstart.feature_id = specification.feature_id
-        quickstart.feature_name = specification.feature_name
-        quickstart.created_at = datetime.now()
-
-        return quickstart
-
     async def generate_quickstart_async(
         self,
         specification: Specification,
         plan: TechnicalPlan,
         language: str | None = None,
+        on_progress: ProgressCallback | None = None,
     ) -> QuickstartGuide:
         """Async version of generate_quickstart()."""
-        prompt = render_template(
-            "quickstart.jinja2",
-            specification=specification.model_dump(mode="json"),
-            plan=plan.model_dump(mode="json"),
+        return await self._generate_async(
+            "quickstart",
+            specification=specification,
+            plan=plan,
             language=language,
+            on_progress=on_progress,
         )
 
-        quickstart = await self.llm.complete_structured_async(
-            prompt=prompt,
-            response_model=QuickstartGuide,
-            system="You are a technical writer creating developer onboarding documentation.",
-        )
+    # =========================================================================
+    # Batch Generation
+    # =========================================================================
+
+    async def generate_all_async(
+        self,
+        specification: Specification,
+        plan: TechnicalPlan,
+        language: str | None = None,
+        max_concurrency: int | None = None,
+        on_progress: Callable[[str, BaseModel], None] | None = None,
+    ) -> ExtendedArtifacts:
+        """
+        Generate all extended artifacts concurrently.
 
-        quickstart.feature_id = specification.feature_id
-        quickstart.feature_name = specification.feature_name
-        quickstart.created_at = datetime.now()
+        The five artifacts only depend on the specification and plan, so the
+        LLM calls are issued together instead of one after another. They run
+        inside batch(), so inputs are serialized once and share created_at.
+        If one artifact fails, the remaining requests are cancelled and its
+        exception is raised.
 
-        return quickstart
+        Args:
+            specification: Feature specification
+            plan: Technical implementation plan
+            language: Optional output language (e.g., 'pt-br', 'es', 'en')
+            max_concurrency: Optional limit on simultaneous LLM requests
+            on_progress: Optional callback receiving the artifact kind (e.g.
+                'data_model') and its partially generated object
+
+        Returns:
+            ExtendedArtifacts with data model, research, API contract,
+            checklist and quickstart guide
+        """
+        semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+        async def run(start: Callable[[], Awaitable[BaseModel]]) -> BaseModel:
+            # The request coroutine is only created once it may run, so a
+            # cancelled task leaves no un-awaited coroutine behind
+            if semaphore is None:
+                return await start()
+            async with semaphore:
+                return await start()
+
+        def progress(kind: str) -> ProgressCallback | None:
+            return functools.partial(on_progress, kind) if on_progress else None
+
+        calls = {
+            "data_model": functools.partial(
+                self.generate_data_model_async,
+                specification,
+                plan,
+                language,
+                progress("data_model"),
+            ),
+            "research": functools.partial(
+                self.generate_research_async, plan, language, progress("research")
+            ),
+            "api_contract": functools.partial(
+                self.generate_api_contract_async,
+                specification,
+                plan,
+                language,
+                progress("api_contract"),
+            ),
+            "checklist": functools.partial(
+                self.generate_checklist_async, specification, language, progress("checklist")
+            ),
+            "quickstart": functools.partial(
+                self.generate_quickstart_async,
+                specification,
+                plan,
+                language,
+                progress("quickstart"),
+            ),
+        }
+
+        # A TaskGroup cancels the remaining requests, including those still
+        # waiting for the semaphore, as soon as one artifact fails
+        with self.batch():
+            try:
+                async with asyncio.TaskGroup() as group:
+                    tasks = {kind: group.create_task(run(start)) for kind, start in calls.items()}
+            except ExceptionGroup as e:
+                raise e.exceptions[0] from None
+
+        return ExtendedArtifacts(**{kind: task.result() for kind, task in tasks.items()})
@@ -5,14 +5,20 @@ This module provides tools to generate feature specifications from
 natural language descriptions.
 """
 
+import logging
 import re
 from datetime import datetime
 
+from pydantic import ValidationError
+
+from speckit.cache import LLMCache, SemanticCache
 from speckit.llm import LiteLLMProvider
 from speckit.schemas import Constitution, Specification
 from speckit.storage.base import StorageBase
 from speckit.templates import render_template
 
+logger = logging.getLogger(__name__)
+
 
 class SpecificationBuilder:
     """
@@ -22,16 +28,24 @@ class SpecificationBuilder:
     entities, constraints, and success criteria.
     """
 
-    def __init__(self, llm: LiteLLMProvider, storage: StorageBase):
+    def __init__(
+        self,
+        llm: LiteLLMProvider,
+        storage: StorageBase,
+        semantic_cache: SemanticCache | None = None,
+    ):
         """
         Initialize specification builder.
 
         Args:
             llm: LLM provider for generation
             storage: Storage backend for persistence
+            semantic_cache: Optional cache to reuse specifications generated
+                for near-duplicate descriptions
         """
         self.llm = llm
         self.storage = storage
+        self.semantic_cache = semantic_cache
 
     def generate(
         self,
@@ -56,6 +70,23 @@ class SpecificationBuilder:
         if feature_id is None:
             feature_id = self._generate_feature_id(feature_description)
 
+        # Reuse a specification generated for the same or a similar description
+        vector = None
+        if self.semantic_cache is not None:
+            scope = self._cache_scope(constitution, language)
+            cached = self.semantic_cache.get_exact(feature_description, scope)
+            if cached is None:
+                try:
+                    vector = self.llm.embed(feature_description)
+                except Exception as e:
+                    # The cache is an optimization; generate without it
+                    logger.warning("Semantic cache lookup skipped, embedding failed: %s", e)
+                else:
+                    cached = self.semantic_cache.get_similar(vector, scope)
+            cached_spec = self._from_cache(cached, feature_id)
+            if cached_spec is not None:
+                return cached_spec
+
         # Render prompt template
         prompt = render_template(
             "specification.jinja2",
@@ -76,6 +107,11 @@ class SpecificationBuilder:
         spec.feature_id = feature_id
         spec.created_at = datetime.now()
 
+        if vector is not None:
+            self.semantic_cache.add(
+                feature_description, vector, scope, spec.model_dump(mode="json")
+            )
+
         return spec
 
     async def generate_async(
@@ -89,6 +125,22 @@ class SpecificationBuilder:
         if feature_id is None:
             feature_id = self._generate_feature_id(feature_description)
 
+        vector = None
+        if self.semantic_cache is not None:
+            scope = self._cache_scope(constitution, language)
+            cached = self.semantic_cache.get_exact(feature_description, scope)
+            if cached is None:
+                try:
+                    vector = await self.llm.embed_async(feature_description)
+                except Exception as e:
+                    # The cache is an optimization; generate without it
+                    logger.warning("Semantic cache lookup skipped, embedding failed: %s", e)
+                else:
+                    cached = self.semantic_cache.get_similar(vector, scope)
+            cached_spec = self._from_cache(cached, feature_id)
+            if cached_spec is not None:
+                return cached_spec
+
         prompt = render_template(
             "specification.jinja2",
             feature_description=feature_description,
@@ -106,6 +158,37 @@ class SpecificationBuilder:
         spec.feature_id = feature_id
         spec.created_at = datetime.now()
 
+        if vector is not None:
+            self.semantic_cache.add(
+                feature_description, vector, scope, spec.model_dump(mode="json")
+            )
+
+        return spec
+
+    def _cache_scope(self, constitution: Constitution | None, language: str | None) -> str:
+        """Identify the prompt context a cached specification is valid for."""
+        return LLMCache.make_key(
+            {
+                "model": self.llm.config.model,
+                "language": language,
+                "constitution": (
+                    constitution.model_dump(mode="json", exclude={"created_at", "updated_at"})
+                    if constitution
+                    else None
+                ),
+            }
+        )
+
+    def _from_cache(self, cached: dict | None, feature_id: str) -> Specification | None:
+        """Rebuild a cached specification for a new feature ID, or None if unusable."""
+        if cached is None:
+            return None
+        try:
+            spec = Specification.model_validate(cached)
+        except ValidationError:
+            return None
+        spec.feature_id = feature_id
+        spec.created_at = datetime.now()
         return spec
 
     def _generate_feature_id(self, description: str) -> str:
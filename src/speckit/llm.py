@@ -7,23 +7,38 @@ This module provides:
 - Support for 100+ LLM providers via LiteLLM
 - Automatic fallback chains
 - Structured output via Instructor
+- Optional response caching for deterministic (temperature 0) calls
 """
 
 import time
-from collections.abc import AsyncIterator, Iterator
+from collections.abc import AsyncIterator, Callable, Iterator
 from dataclasses import dataclass, field
-from typing import Any, TypeVar
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import litellm
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 
 from speckit.config import LLMConfig
 
+if TYPE_CHECKING:
+    from speckit.cache import LLMCache
+
 # Enable verbose logging for debugging
 litellm.set_verbose = False
 
 T = TypeVar("T", bound=BaseModel)
 
+# Receives partially populated structured outputs while they stream in
+ProgressCallback = Callable[[BaseModel], None]
+
+
+class _NoFallbackError(Exception):
+    """Wraps an error that must be raised as-is instead of trying the next model."""
+
+    def __init__(self, error: Exception):
+        super().__init__(str(error))
+        self.error = error
+
 
 @dataclass
 class LLMResponse:
@@ -70,15 +85,18 @@ class LiteLLMProvider:
         >>> print(response.content)
     """
 
-    def __init__(self, config: LLMConfig):
+    def __init__(self, config: LLMConfig, cache: "LLMCache | None" = None):
         """
         Initialize the LLM provider.
 
         Args:
             config: LLM configuration with model, temperature, etc.
+            cache: Optional response cache, used only when temperature is 0
         """
         self.config = config
+        self.cache = cache
         self._instructor_client = None
+        self._async_instructor_client = None
 
     def _get_completion_kwargs(self, **overrides) -> dict[str, Any]:
         """Build kwargs for LiteLLM completion calls."""
@@ -101,6 +119,90 @@ class LiteLLMProvider:
         kwargs.update(overrides)
         return kwargs
 
+    @staticmethod
+    def _supports_prompt_caching(model: str) -> bool:
+        """Check whether a model is served by Anthropic, which accepts cache_control blocks."""
+        return model.startswith(("anthropic/", "claude-"))
+
+    def _with_prompt_caching(self, messages: list[dict], model: str) -> list[dict]:
+        """
+        Mark the system prompt as a cacheable prefix for Anthropic models.
+
+        System prompts are identical across calls of the same kind, so the
+        provider can reuse their prefill instead of reprocessing them. Other
+        providers get the messages unchanged.
+        """
+        if not messages or messages[0]["role"] != "system":
+            return messages
+        if not self._supports_prompt_caching(model):
+            return messages
+
+        system = messages[0]
+        content = [
+            {"type": "text", "text": system["content"], "cache_control": {"type": "ephemeral"}}
+        ]
+        return [{**system, "content": content}, *messages[1:]]
+
+    def _cache_request(
+        self,
+        kwargs: dict,
+        response_model: type[BaseModel] | None = None,
+    ) -> dict | None:
+        """
+        Build the cache payload for a request, or None if it must not be cached.
+
+        Only deterministic requests (temperature 0) are cached. Credentials and
+        transport settings are left out of the key.
+        """
+        if self.cache is None or kwargs.get("temperature") != 0:
+            return None
+
+        request = {
+            key: value
+            for key, value in kwargs.items()
+            if key not in ("api_key", "api_base", "timeout", "response_model")
+        }
+        request["fallback_models"] = self.config.fallback_models
+        if response_model is not None:
+            request["response_model"] = f"{response_model.__module__}.{response_model.__qualname__}"
+        return request
+
+    def _cached_response(self, request: dict | None) -> LLMResponse | None:
+        """Get a cached text completion, ignoring entries with an unexpected shape."""
+        if request is None:
+            return None
+        cached = self.cache.get(request)
+        if not isinstance(cached, dict) or not {"content", "model", "usage"} <= cached.keys():
+            return None
+        return LLMResponse(content=cached["content"], model=cached["model"], usage=cached["usage"])
+
+    def _store_response(self, request: dict | None, response: LLMResponse) -> LLMResponse:
+        """Store a text completion in the cache."""
+        if request is not None:
+            self.cache.set(
+                request,
+                {"content": response.content, "model": response.model, "usage": response.usage},
+            )
+        return response
+
+    def _cached_structured(self, request: dict | None, response_model: type[T]) -> T | None:
+        """Get a cached structured output, ignoring entries that no longer validate."""
+        if request is None:
+            return None
+        cached = self.cache.get(request)
+        if cached is None:
+            return None
+        try:
+            return response_model.model_validate(cached)
+        except ValidationError:
+            return None
+
+    def _store_structured(self, request: dict | None, result: T) -> T:
+        """Store a structured output in the cache."""
+        if request is not None:
+            self.cache.set(request, result.model_dump(mode="json"))
+        return result
+
     def complete(
         self,
         prompt: str,
@@ -129,7 +231,12 @@ class LiteLLMProvider:
         completion_kwargs = self._get_completion_kwargs(**kwargs)
         completion_kwargs["messages"] = messages
 
-        return self._complete_with_fallback(completion_kwargs)
+        request = self._cache_request(completion_kwargs)
+        cached = self._cached_response(request)
+        if cached is not None:
+            return cached
+
+        return self._store_response(request, self._complete_with_fallback(completion_kwargs))
 
     async def complete_async(
         self,
@@ -156,7 +263,13 @@ class LiteLLMProvider:
         completion_kwargs = self._get_completion_kwargs(**kwargs)
         completion_kwargs["messages"] = messages
 
-        return await self._complete_with_fallback_async(completion_kwargs)
+        request = self._cache_request(completion_kwargs)
+        cached = self._cached_response(request)
+        if cached is not None:
+            return cached
+
+        response = await self._complete_with_fallback_async(completion_kwargs)
+        return self._store_response(request, response)
 
     def complete_structured(
         self,
@@ -205,13 +318,20 @@ class LiteLLMProvider:
         completion_kwargs["messages"] = messages
         completion_kwargs["response_model"] = response_model
 
-        return self._complete_structured_with_fallback(completion_kwargs, response_model)
+        request = self._cache_request(completion_kwargs, response_model)
+        cached = self._cached_structured(request, response_model)
+        if cached is not None:
+            return cached
+
+        result = self._complete_structured_with_fallback(completion_kwargs, response_model)
+        return self._store_structured(request, result)
 
     async def complete_structured_async(
         self,
         prompt: str,
         response_model: type[T],
         system: str | None = None,
+        on_progress: ProgressCallback | None = None,
         **kwargs,
     ) -> T:
         """
@@ -221,6 +341,10 @@ class LiteLLMProvider:
             prompt: The user prompt
             response_model: Pydantic model class for the response
             system: Optional system message
+            on_progress: Optional callback receiving partially populated
+                objects while the response streams in. Errors it raises
+                propagate unchanged, and a stream that fails after its first
+                partial is not retried with fallback models
             **kwargs: Additional arguments passed to Instructor
 
         Returns:
@@ -228,8 +352,10 @@ class LiteLLMProvider:
         """
         import instructor
 
-        # Use async client
-        client = instructor.from_litellm(litellm.acompletion)
+        # Initialize async instructor client once so concurrent calls share it
+        if self._async_instructor_client is None:
+            self._async_instructor_client = instructor.from_litellm(litellm.acompletion)
+        client = self._async_instructor_client
 
         messages = []
         if system:
@@ -240,6 +366,11 @@ class LiteLLMProvider:
         completion_kwargs["messages"] = messages
         completion_kwargs["response_model"] = response_model
 
+        request = self._cache_request(completion_kwargs, response_model)
+        cached = self._cached_structured(request, response_model)
+        if cached is not None:
+            return cached
+
         # Try with fallback models
         models_to_try = [self.config.model] + self.config.fallback_models
         last_error = None
@@ -247,12 +378,87 @@ class LiteLLMProvider:
         for model in models_to_try:
             try:
                 completion_kwargs["model"] = model
-                return await client.create(**completion_kwargs)
+                completion_kwargs["messages"] = self._with_prompt_caching(messages, model)
+                if on_progress is None:
+                    result = await client.create(**completion_kwargs)
+                else:
+                    result = await self._stream_structured(
+                        client, completion_kwargs, response_model, on_progress
+                    )
+                break
+            except _NoFallbackError as e:
+                raise e.error from None
             except Exception as e:
                 last_error = e
                 continue
+        else:
+            raise last_error or Exception("All models failed")
 
-        raise last_error or Exception("All models failed")
+        # Stored outside the fallback loop so cache errors never trigger a retry
+        return self._store_structured(request, result)
+
+    def _get_embedding_kwargs(self, text: str) -> dict[str, Any]:
+        """Build kwargs for LiteLLM embedding calls."""
+        kwargs = {
+            "model": self.config.embedding_model,
+            "input": [text],
+            "timeout": self.config.timeout,
+        }
+        if self.config.api_key:
+            kwargs["api_key"] = self.config.api_key
+        if self.config.api_base:
+            kwargs["api_base"] = self.config.api_base
+        return kwargs
+
+    def embed(self, text: str) -> list[float]:
+        """
+        Get the embedding vector of a text.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Embedding from the configured embedding model
+        """
+        response = litellm.embedding(**self._get_embedding_kwargs(text))
+        return response.data[0]["embedding"]
+
+    async def embed_async(self, text: str) -> list[float]:
+        """Async version of embed()."""
+        response = await litellm.aembedding(**self._get_embedding_kwargs(text))
+        return response.data[0]["embedding"]
+
+    @staticmethod
+    async def _stream_structured(
+        client: Any,
+        kwargs: dict,
+        response_model: type[T],
+        on_progress: ProgressCallback,
+    ) -> T:
+        """
+        Report partial objects to a callback and return the validated final object.
+
+        Errors raised by the callback, and any failure after the first partial
+        was delivered, are wrapped in _NoFallbackError: the callback has
+        already seen this model's output, so retrying with another model
+        would interleave two streams.
+        """
+        partial = None
+        try:
+            async for partial in client.create_partial(**kwargs):
+                try:
+                    on_progress(partial)
+                except Exception as e:
+                    raise _NoFallbackError(e) from e
+            if partial is None:
+                raise ValueError("LLM returned no structured output")
+            return response_model.model_validate(partial.model_dump(exclude_none=True))
+        except _NoFallbackError:
+            raise
+        except Exception as e:
+            if partial is not None:
+                raise _NoFallbackError(e) from e
+            raise
 
     def stream(
         self,
@@ -281,7 +487,9 @@ class LiteLLMProvider:
         messages.append({"role": "user", "content": prompt})
 
         completion_kwargs = self._get_completion_kwargs(**kwargs)
-        completion_kwargs["messages"] = messages
+        completion_kwargs["messages"] = self._with_prompt_caching(
+            messages, completion_kwargs["model"]
+        )
         completion_kwargs["stream"] = True
 
         response = litellm.completion(**completion_kwargs)
@@ -312,7 +520,9 @@ class LiteLLMProvider:
         messages.append({"role": "user", "content": prompt})
 
         completion_kwargs = self._get_completion_kwargs(**kwargs)
-        completion_kwargs["messages"] = messages
+        completion_kwargs["messages"] = self._with_prompt_caching(
+            messages, completion_kwargs["model"]
+        )
         completion_kwargs["stream"] = True
 
         response = await litellm.acompletion(**completion_kwargs)
@@ -327,12 +537,14 @@ class LiteLLMProvider:
         Tries the primary model first, then falls back to configured
         fallback models on failure.
         """
+        messages = kwargs["messages"]
         models_to_try = [self.config.model] + self.config.fallback_models
         last_error = None
 
         for _attempt, model in enumerate(models_to_try):
             try:
                 kwargs["model"] = model
+                kwargs["messages"] = self._with_prompt_caching(messages, model)
                 response = self._execute_with_retry(kwargs)
                 return self._parse_response(response, model)
             except Exception as e:
@@ -344,12 +556,14 @@ class LiteLLMProvider:
 
     async def _complete_with_fallback_async(self, kwargs: dict) -> LLMResponse:
         """Execute async completion with automatic fallback."""
+        messages = kwargs["messages"]
         models_to_try = [self.config.model] + self.config.fallback_models
         last_error = None
 
         for model in models_to_try:
             try:
                 kwargs["model"] = model
+                kwargs["messages"] = self._with_prompt_caching(messages, model)
                 response = await self._execute_with_retry_async(kwargs)
                 return self._parse_response(response, model)
             except Exception as e:
@@ -364,12 +578,14 @@ class LiteLLMProvider:
         response_model: type[T],
     ) -> T:
         """Execute structured completion with automatic fallback."""
+        messages = kwargs["messages"]
         models_to_try = [self.config.model] + self.config.fallback_models
         last_error = None
 
         for model in models_to_try:
             try:
                 kwargs["model"] = model
+                kwargs["messages"] = self._with_prompt_caching(messages, model)
                 return self._instructor_client.create(**kwargs)
             except Exception as e:
                 last_error = e
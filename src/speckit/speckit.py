@@ -12,25 +12,74 @@ Example:
     >>> tasks = kit.tasks(plan)
 """
 
+import importlib
 from pathlib import Path
+from types import ModuleType
+from typing import TYPE_CHECKING
 
 from speckit.config import LLMConfig, SpecKitConfig
-from speckit.llm import LiteLLMProvider
-from speckit.schemas import (
-    AnalysisReport,
-    APIContract,
-    ClarificationQuestion,
-    Constitution,
-    DataModel,
-    QualityChecklist,
-    QuickstartGuide,
-    ResearchFindings,
-    Specification,
-    TaskBreakdown,
-    TechnicalPlan,
-    TechStack,
-)
-from speckit.storage.file_storage import FileStorage
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pydantic import BaseModel
+
+    from speckit.cache import SemanticCache
+    from speckit.core.analyzer import ConsistencyAnalyzer
+    from speckit.core.artifacts import ArtifactGenerator, ExtendedArtifacts
+    from speckit.core.clarifier import ClarificationEngine
+    from speckit.core.constitution import ConstitutionManager
+    from speckit.core.planner import TechnicalPlanner
+    from speckit.core.specification import SpecificationBuilder
+    from speckit.core.tasker import TaskGenerator
+    from speckit.llm import LiteLLMProvider, ProgressCallback
+    from speckit.schemas import (
+        AnalysisReport,
+        APIContract,
+        ClarificationQuestion,
+        Constitution,
+        DataModel,
+        QualityChecklist,
+        QuickstartGuide,
+        ResearchFindings,
+        Specification,
+        TaskBreakdown,
+        TechnicalPlan,
+        TechStack,
+    )
+    from speckit.storage.file_storage import FileStorage
+
+# Artifact type -> (storage save method, whether it is saved per feature),
+# built on first save so the schemas are not imported with this module
+_SAVE_DISPATCH: dict[type, tuple[str, bool]] = {}
+
+
+def _save_dispatch() -> dict[type, tuple[str, bool]]:
+    """Get the save dispatch table, importing the schemas on first use."""
+    if not _SAVE_DISPATCH:
+        from speckit.schemas import Constitution, Specification, TaskBreakdown, TechnicalPlan
+
+        _SAVE_DISPATCH.update(
+            {
+                Constitution: ("save_constitution", False),
+                Specification: ("save_specification", True),
+                TechnicalPlan: ("save_plan", True),
+                TaskBreakdown: ("save_tasks", True),
+            }
+        )
+    return _SAVE_DISPATCH
+
+
+# Core workflow modules, imported once on first use
+_MODULE_CACHE: dict[str, ModuleType] = {}
+
+
+def _load(name: str) -> ModuleType:
+    """Import a core module on first use and return the cached module."""
+    module = _MODULE_CACHE.get(name)
+    if module is None:
+        module = _MODULE_CACHE[name] = importlib.import_module(name)
+    return module
 
 
 class SpecKit:
@@ -101,16 +150,30 @@ class SpecKit:
         self._artifact_generator = None
 
     @property
-    def llm(self) -> LiteLLMProvider:
+    def llm(self) -> "LiteLLMProvider":
         """Get the LLM provider (lazy initialization)."""
         if self._llm is None:
-            self._llm = LiteLLMProvider(self.config.llm)
+            from speckit.llm import LiteLLMProvider
+
+            cache = None
+            if self.config.llm.cache_responses:
+                from speckit.cache import FileCacheBackend, LLMCache
+
+                cache = LLMCache(FileCacheBackend(self.config.config_path / "cache"))
+            self._llm = LiteLLMProvider(self.config.llm, cache=cache)
         return self._llm
 
     @property
-    def storage(self) -> FileStorage:
-        """Get the storage backend (lazy initialization)."""
+    def storage(self) -> "FileStorage":
+        """
+        Get the storage backend (lazy initialization).
+
+        The backend takes project_path and config.storage as they are on
+        first access; later changes to them do not move existing storage.
+        """
         if self._storage is None:
+            from speckit.storage.file_storage import FileStorage
+
             self._storage = FileStorage(
                 self.config.project_path,
                 specs_dir=self.config.storage.specs_dir,
@@ -118,6 +181,82 @@ class SpecKit:
             )
         return self._storage
 
+    @property
+    def constitution_manager(self) -> "ConstitutionManager":
+        """Get the constitution manager (lazy initialization)."""
+        if self._constitution_manager is None:
+            self._constitution_manager = _load("speckit.core.constitution").ConstitutionManager(
+                self.llm, self.storage
+            )
+        return self._constitution_manager
+
+    @property
+    def specification_builder(self) -> "SpecificationBuilder":
+        """Get the specification builder (lazy initialization)."""
+        if self._specification_builder is None:
+            self._specification_builder = _load("speckit.core.specification").SpecificationBuilder(
+                self.llm, self.storage, semantic_cache=self._semantic_cache()
+            )
+        return self._specification_builder
+
+    @property
+    def clarification_engine(self) -> "ClarificationEngine":
+        """Get the clarification engine (lazy initialization)."""
+        if self._clarification_engine is None:
+            self._clarification_engine = _load("speckit.core.clarifier").ClarificationEngine(
+                self.llm
+            )
+        return self._clarification_engine
+
+    @property
+    def technical_planner(self) -> "TechnicalPlanner":
+        """Get the technical planner (lazy initialization)."""
+        if self._technical_planner is None:
+            self._technical_planner = _load("speckit.core.planner").TechnicalPlanner(
+                self.llm, self.storage
+            )
+        return self._technical_planner
+
+    @property
+    def task_generator(self) -> "TaskGenerator":
+        """Get the task generator (lazy initialization)."""
+        if self._task_generator is None:
+            self._task_generator = _load("speckit.core.tasker").TaskGenerator(
+                self.llm, self.storage
+            )
+        return self._task_generator
+
+    @property
+    def consistency_analyzer(self) -> "ConsistencyAnalyzer":
+        """Get the consistency analyzer (lazy initialization)."""
+        if self._consistency_analyzer is None:
+            self._consistency_analyzer = _load("speckit.core.analyzer").ConsistencyAnalyzer(
+                self.llm
+            )
+        return self._consistency_analyzer
+
+    @property
+    def artifact_generator(self) -> "ArtifactGenerator":
+        """Get the artifact generator (lazy initialization)."""
+        if self._artifact_generator is None:
+            self._artifact_generator = _load("speckit.core.artifacts").ArtifactGenerator(
+                self.llm, self.storage
+            )
+        return self._artifact_generator
+
+    def _semantic_cache(self) -> "SemanticCache | None":
+        """Create the specification similarity cache if it is enabled."""
+        threshold = self.config.llm.semantic_cache_threshold
+        if threshold is None:
+            return None
+
+        from speckit.cache import SemanticCache
+
+        return SemanticCache(
+            threshold=threshold,
+            path=self.config.config_path / "cache" / "specifications.json",
+        )
+
     # =========================================================================
     # Constitution Phase
     # =========================================================================
@@ -127,7 +266,7 @@ class SpecKit:
         project_name: str,
         principles: list[str] | None = None,
         interactive: bool = False,
-    ) -> Constitution:
+    ) -> "Constitution":
         """
         Create or update project constitution.
 
@@ -139,12 +278,7 @@ class SpecKit:
         Returns:
             Constitution model with project principles
         """
-        from speckit.core.constitution import ConstitutionManager
-
-        if self._constitution_manager is None:
-            self._constitution_manager = ConstitutionManager(self.llm, self.storage)
-
-        return self._constitution_manager.create(
+        return self.constitution_manager.create(
             project_name=project_name,
             seed_principles=principles,
             interactive=interactive,
@@ -158,7 +292,7 @@ class SpecKit:
         self,
         feature_description: str,
         feature_id: str | None = None,
-    ) -> Specification:
+    ) -> "Specification":
         """
         Generate a feature specification from natural language.
 
@@ -177,15 +311,10 @@ class SpecKit:
             ...     - Session management with JWT
             ... ''')
         """
-        from speckit.core.specification import SpecificationBuilder
-
-        if self._specification_builder is None:
-            self._specification_builder = SpecificationBuilder(self.llm, self.storage)
-
         # Load constitution for context if available
         constitution = self.storage.load_constitution()
 
-        return self._specification_builder.generate(
+        return self.specification_builder.generate(
             feature_description=feature_description,
             feature_id=feature_id,
             constitution=constitution,
@@ -196,16 +325,11 @@ class SpecKit:
         self,
         feature_description: str,
         feature_id: str | None = None,
-    ) -> Specification:
+    ) -> "Specification":
         """Async version of specify()."""
-        from speckit.core.specification import SpecificationBuilder
-
-        if self._specification_builder is None:
-            self._specification_builder = SpecificationBuilder(self.llm, self.storage)
-
         constitution = self.storage.load_constitution()
 
-        return await self._specification_builder.generate_async(
+        return await self.specification_builder.generate_async(
             feature_description=feature_description,
             feature_id=feature_id,
             constitution=constitution,
@@ -218,9 +342,9 @@ class SpecKit:
 
     def clarify(
         self,
-        specification: Specification,
+        specification: "Specification",
         max_questions: int = 5,
-    ) -> tuple[Specification, list[ClarificationQuestion]]:
+    ) -> "tuple[Specification, list[ClarificationQuestion]]":
         """
         Identify ambiguities and generate clarification questions.
 
@@ -231,22 +355,17 @@ class SpecKit:
         Returns:
             Tuple of (updated spec, questions needing answers)
         """
-        from speckit.core.clarifier import ClarificationEngine
-
-        if self._clarification_engine is None:
-            self._clarification_engine = ClarificationEngine(self.llm)
-
-        return self._clarification_engine.clarify(
+        return self.clarification_engine.clarify(
             specification=specification,
             max_questions=max_questions,
         )
 
     def apply_clarification(
         self,
-        specification: Specification,
+        specification: "Specification",
         question_id: str,
         answer: str,
-    ) -> Specification:
+    ) -> "Specification":
         """
         Apply an answer to a clarification question.
 
@@ -258,12 +377,7 @@ class SpecKit:
         Returns:
             Updated specification with the clarification resolved
         """
-        from speckit.core.clarifier import ClarificationEngine
-
-        if self._clarification_engine is None:
-            self._clarification_engine = ClarificationEngine(self.llm)
-
-        return self._clarification_engine.apply_answer(
+        return self.clarification_engine.apply_answer(
             specification=specification,
             question_id=question_id,
             answer=answer,
@@ -275,9 +389,9 @@ class SpecKit:
 
     def plan(
         self,
-        specification: Specification,
-        tech_stack: TechStack | None = None,
-    ) -> TechnicalPlan:
+        specification: "Specification",
+        tech_stack: "TechStack | None" = None,
+    ) -> "TechnicalPlan":
         """
         Generate technical implementation plan.
 
@@ -288,15 +402,10 @@ class SpecKit:
         Returns:
             TechnicalPlan model with architecture and components
         """
-        from speckit.core.planner import TechnicalPlanner
-
-        if self._technical_planner is None:
-            self._technical_planner = TechnicalPlanner(self.llm, self.storage)
-
         # Load constitution for context
         constitution = self.storage.load_constitution()
 
-        return self._technical_planner.plan(
+        return self.technical_planner.plan(
             specification=specification,
             constitution=constitution,
             tech_stack=tech_stack,
@@ -305,18 +414,13 @@ class SpecKit:
 
     async def plan_async(
         self,
-        specification: Specification,
-        tech_stack: TechStack | None = None,
-    ) -> TechnicalPlan:
+        specification: "Specification",
+        tech_stack: "TechStack | None" = None,
+    ) -> "TechnicalPlan":
         """Async version of plan()."""
-        from speckit.core.planner import TechnicalPlanner
-
-        if self._technical_planner is None:
-            self._technical_planner = TechnicalPlanner(self.llm, self.storage)
-
         constitution = self.storage.load_constitution()
 
-        return await self._technical_planner.plan_async(
+        return await self.technical_planner.plan_async(
             specification=specification,
             constitution=constitution,
             tech_stack=tech_stack,
@@ -329,9 +433,9 @@ class SpecKit:
 
     def tasks(
         self,
-        plan: TechnicalPlan,
+        plan: "TechnicalPlan",
         parallel_friendly: bool = True,
-    ) -> TaskBreakdown:
+    ) -> "TaskBreakdown":
         """
         Generate implementation tasks from plan.
 
@@ -342,15 +446,10 @@ class SpecKit:
         Returns:
             TaskBreakdown model with ordered tasks
         """
-        from speckit.core.tasker import TaskGenerator
-
-        if self._task_generator is None:
-            self._task_generator = TaskGenerator(self.llm, self.storage)
-
         # Load specification for context
         spec = self.storage.load_specification(plan.feature_id)
 
-        return self._task_generator.generate(
+        return self.task_generator.generate(
             plan=plan,
             specification=spec,
             parallel_friendly=parallel_friendly,
@@ -359,18 +458,13 @@ class SpecKit:
 
     async def tasks_async(
         self,
-        plan: TechnicalPlan,
+        plan: "TechnicalPlan",
         parallel_friendly: bool = True,
-    ) -> TaskBreakdown:
+    ) -> "TaskBreakdown":
         """Async version of tasks()."""
-        from speckit.core.tasker import TaskGenerator
-
-        if self._task_generator is None:
-            self._task_generator = TaskGenerator(self.llm, self.storage)
-
         spec = self.storage.load_specification(plan.feature_id)
 
-        return await self._task_generator.generate_async(
+        return await self.task_generator.generate_async(
             plan=plan,
             specification=spec,
             parallel_friendly=parallel_friendly,
@@ -383,10 +477,10 @@ class SpecKit:
 
     def analyze(
         self,
-        specification: Specification,
-        plan: TechnicalPlan,
-        tasks: TaskBreakdown,
-    ) -> AnalysisReport:
+        specification: "Specification",
+        plan: "TechnicalPlan",
+        tasks: "TaskBreakdown",
+    ) -> "AnalysisReport":
         """
         Check consistency across all artifacts.
 
@@ -398,12 +492,7 @@ class SpecKit:
         Returns:
             AnalysisReport with issues and recommendations
         """
-        from speckit.core.analyzer import ConsistencyAnalyzer
-
-        if self._consistency_analyzer is None:
-            self._consistency_analyzer = ConsistencyAnalyzer(self.llm)
-
-        return self._consistency_analyzer.analyze(
+        return self.consistency_analyzer.analyze(
             specification=specification,
             plan=plan,
             tasks=tasks,
@@ -415,7 +504,7 @@ class SpecKit:
 
     def save(
         self,
-        artifact: Constitution | Specification | TechnicalPlan | TaskBreakdown,
+        artifact: "Constitution | Specification | TechnicalPlan | TaskBreakdown",
         feature_id: str | None = None,
     ) -> Path:
         """
@@ -428,29 +517,32 @@ class SpecKit:
         Returns:
             Path to the saved file
         """
-        if isinstance(artifact, Constitution):
-            return self.storage.save_constitution(artifact)
-        elif isinstance(artifact, Specification):
-            fid = feature_id or artifact.feature_id
-            return self.storage.save_specification(artifact, fid)
-        elif isinstance(artifact, TechnicalPlan):
-            fid = feature_id or artifact.feature_id
-            return self.storage.save_plan(artifact, fid)
-        elif isinstance(artifact, TaskBreakdown):
-            fid = feature_id or artifact.feature_id
-            return self.storage.save_tasks(artifact, fid)
-        else:
-            raise TypeError(f"Unknown artifact type: {type(artifact)}")
+        dispatch = _save_dispatch()
+        entry = dispatch.get(type(artifact))
+        if entry is None:
+            # Subclasses of the artifact models resolve through their MRO
+            entry = next(
+                (dispatch[cls] for cls in type(artifact).__mro__ if cls in dispatch),
+                None,
+            )
+            if entry is None:
+                raise TypeError(f"Unknown artifact type: {type(artifact)}")
+
+        method_name, per_feature = entry
+        save_method = getattr(self.storage, method_name)
+        if per_feature:
+            return save_method(artifact, feature_id or artifact.feature_id)
+        return save_method(artifact)
 
-    def load_specification(self, feature_id: str) -> Specification | None:
+    def load_specification(self, feature_id: str) -> "Specification | None":
         """Load a specification by feature ID."""
         return self.storage.load_specification(feature_id)
 
-    def load_plan(self, feature_id: str) -> TechnicalPlan | None:
+    def load_plan(self, feature_id: str) -> "TechnicalPlan | None":
         """Load a plan by feature ID."""
         return self.storage.load_plan(feature_id)
 
-    def load_tasks(self, feature_id: str) -> TaskBreakdown | None:
+    def load_tasks(self, feature_id: str) -> "TaskBreakdown | None":
         """Load tasks by feature ID."""
         return self.storage.load_tasks(feature_id)
 
@@ -464,9 +556,9 @@ class SpecKit:
 
     def generate_data_model(
         self,
-        specification: Specification,
-        plan: TechnicalPlan,
-    ) -> DataModel:
+        specification: "Specification",
+        plan: "TechnicalPlan",
+    ) -> "DataModel":
         """
         Generate database schema and data model.
 
@@ -483,12 +575,7 @@ class SpecKit:
             >>> data_model = kit.generate_data_model(spec, plan)
             >>> kit.storage.save_data_model(data_model, "001-user-auth")
         """
-        from speckit.core.artifacts import ArtifactGenerator
-
-        if self._artifact_generator is None:
-            self._artifact_generator = ArtifactGenerator(self.llm, self.storage)
-
-        return self._artifact_generator.generate_data_model(
+        return self.artifact_generator.generate_data_model(
             specification=specification,
             plan=plan,
             language=self.config.language,
@@ -496,25 +583,22 @@ class SpecKit:
 
     async def generate_data_model_async(
         self,
-        specification: Specification,
-        plan: TechnicalPlan,
-    ) -> DataModel:
+        specification: "Specification",
+        plan: "TechnicalPlan",
+        on_progress: "ProgressCallback | None" = None,
+    ) -> "DataModel":
         """Async version of generate_data_model()."""
-        from speckit.core.artifacts import ArtifactGenerator
-
-        if self._artifact_generator is None:
-            self._artifact_generator = ArtifactGenerator(self.llm, self.storage)
-
-        return await self._artifact_generator.generate_data_model_async(
+        return await self.artifact_generator.generate_data_model_async(
             specification=specification,
             plan=plan,
             language=self.config.language,
+            on_progress=on_progress,
         )
 
     def generate_research(
         self,
-        plan: TechnicalPlan,
-    ) -> ResearchFindings:
+        plan: "TechnicalPlan",
+    ) -> "ResearchFindings":
         """
         Generate technology research and decision documentation.
 
@@ -529,36 +613,28 @@ class SpecKit:
             >>> research = kit.generate_research(plan)
             >>> kit.storage.save_research(research, "001-user-auth")
         """
-        from speckit.core.artifacts import ArtifactGenerator
-
-        if self._artifact_generator is None:
-            self._artifact_generator = ArtifactGenerator(self.llm, self.storage)
-
-        return self._artifact_generator.generate_research(
+        return self.artifact_generator.generate_research(
             plan=plan,
             language=self.config.language,
         )
 
     async def generate_research_async(
         self,
-        plan: TechnicalPlan,
-    ) -> ResearchFindings:
+        plan: "TechnicalPlan",
+        on_progress: "ProgressCallback | None" = None,
+    ) -> "ResearchFindings":
         """Async version of generate_research()."""
-        from speckit.core.artifacts import ArtifactGenerator
-
-        if self._artifact_generator is None:
-            self._artifact_generator = ArtifactGenerator(self.llm, self.storage)
-
-        return await self._artifact_generator.generate_research_async(
+        return await self.artifact_generator.generate_research_async(
             plan=plan,
             language=self.config.language,
+            on_progress=on_progress,
         )
 
     def generate_api_contract(
         self,
-        specification: Specification,
-        plan: TechnicalPlan,
-    ) -> APIContract:
+        specification: "Specification",
+        plan: "TechnicalPlan",
+    ) -> "APIContract":
         """
         Generate API specification with endpoints and schemas.
 
@@ -575,12 +651,7 @@ class SpecKit:
             >>> contract = kit.generate_api_contract(spec, plan)
             >>> kit.storage.save_api_contract(contract, "001-user-auth")
         """
-        from speckit.core.artifacts import ArtifactGenerator
-
-        if self._artifact_generator is None:
-            self._artifact_generator = ArtifactGenerator(self.llm, self.storage)
-
-        return self._artifact_generator.generate_api_contract(
+        return self.artifact_generator.generate_api_contract(
             specification=specification,
             plan=plan,
             language=self.config.language,
@@ -588,25 +659,22 @@ class SpecKit:
 
     async def generate_api_contract_async(
         self,
-        specification: Specification,
-        plan: TechnicalPlan,
-    ) -> APIContract:
+        specification: "Specification",
+        plan: "TechnicalPlan",
+        on_progress: "ProgressCallback | None" = None,
+    ) -> "APIContract":
         """Async version of generate_api_contract()."""
-        from speckit.core.artifacts import ArtifactGenerator
-
-        if self._artifact_generator is None:
-            self._artifact_generator = ArtifactGenerator(self.llm, self.storage)
-
-        return await self._artifact_generator.generate_api_contract_async(
+        return await self.artifact_generator.generate_api_contract_async(
             specification=specification,
             plan=plan,
             language=self.config.language,
+            on_progress=on_progress,
         )
 
     def generate_checklist(
         self,
-        specification: Specification,
-    ) -> QualityChecklist:
+        specification: "Specification",
+    ) -> "QualityChecklist":
         """
         Generate quality validation checklist for specification.
 
@@ -621,36 +689,28 @@ class SpecKit:
             >>> checklist = kit.generate_checklist(spec)
             >>> kit.storage.save_checklist(checklist, "001-user-auth")
         """
-        from speckit.core.artifacts import ArtifactGenerator
-
-        if self._artifact_generator is None:
-            self._artifact_generator = ArtifactGenerator(self.llm, self.storage)
-
-        return self._artifact_generator.generate_checklist(
+        return self.artifact_generator.generate_checklist(
             specification=specification,
             language=self.config.language,
         )
 
     async def generate_checklist_async(
         self,
-        specification: Specification,
-    ) -> QualityChecklist:
+        specification: "Specification",
+        on_progress: "ProgressCallback | None" = None,
+    ) -> "QualityChecklist":
         """Async version of generate_checklist()."""
-        from speckit.core.artifacts import ArtifactGenerator
-
-        if self._artifact_generator is None:
-            self._artifact_generator = ArtifactGenerator(self.llm, self.storage)
-
-        return await self._artifact_generator.generate_checklist_async(
+        return await self.artifact_generator.generate_checklist_async(
             specification=specification,
             language=self.config.language,
+            on_progress=on_progress,
         )
 
     def generate_quickstart(
         self,
-        specification: Specification,
-        plan: TechnicalPlan,
-    ) -> QuickstartGuide:
+        specification: "Specification",
+        plan: "TechnicalPlan",
+    ) -> "QuickstartGuide":
         """
         Generate quickstart guide for developers.
 
@@ -667,12 +727,7 @@ class SpecKit:
             >>> quickstart = kit.generate_quickstart(spec, plan)
             >>> kit.storage.save_quickstart(quickstart, "001-user-auth")
         """
-        from speckit.core.artifacts import ArtifactGenerator
-
-        if self._artifact_generator is None:
-            self._artifact_generator = ArtifactGenerator(self.llm, self.storage)
-
-        return self._artifact_generator.generate_quickstart(
+        return self.artifact_generator.generate_quickstart(
             specification=specification,
             plan=plan,
             language=self.config.language,
@@ -680,17 +735,47 @@ class SpecKit:
 
     async def generate_quickstart_async(
         self,
-        specification: Specification,
-        plan: TechnicalPlan,
-    ) -> QuickstartGuide:
+        specification: "Specification",
+        plan: "TechnicalPlan",
+        on_progress: "ProgressCallback | None" = None,
+    ) -> "QuickstartGuide":
         """Async version of generate_quickstart()."""
-        from speckit.core.artifacts import ArtifactGenerator
+        return await self.artifact_generator.generate_quickstart_async(
+            specification=specification,
+            plan=plan,
+            language=self.config.language,
+            on_progress=on_progress,
+        )
 
-        if self._artifact_generator is None:
-            self._artifact_generator = ArtifactGenerator(self.llm, self.storage)
+    async def generate_all_async(
+        self,
+        specification: "Specification",
+        plan: "TechnicalPlan",
+        on_progress: "Callable[[str, BaseModel], None] | None" = None,
+    ) -> "ExtendedArtifacts":
+        """
+        Generate all extended artifacts concurrently.
 
-        return await self._artifact_generator.generate_quickstart_async(
+        Issues the data model, research, API contract, checklist and quickstart
+        requests together, with at most config.llm.max_concurrency in flight.
+
+        Args:
+            specification: Feature specification
+            plan: Technical implementation plan
+            on_progress: Optional callback receiving the artifact kind and its
+                partially generated object as responses stream in
+
+        Returns:
+            ExtendedArtifacts with all five generated artifacts
+
+        Example:
+            >>> artifacts = await kit.generate_all_async(spec, plan)
+            >>> kit.storage.save_data_model(artifacts.data_model, spec.feature_id)
+        """
+        return await self.artifact_generator.generate_all_async(
             specification=specification,
             plan=plan,
             language=self.config.language,
+            max_concurrency=self.config.llm.max_concurrency,
+            on_progress=on_progress,
         )
@@ -8,6 +8,7 @@ This module provides Markdown file storage with:
 - Markdown parsing and generation
 """
 
+import os
 import re
 import shutil
 from datetime import datetime
@@ -56,6 +57,18 @@ class FileStorage(StorageBase):
     CHECKLIST_FILE = "checklists/requirements.md"
     QUICKSTART_FILE = "quickstart.md"
 
+    # Artifact type -> path relative to the feature directory
+    ARTIFACT_FILES = {
+        "spec": SPEC_FILE,
+        "plan": PLAN_FILE,
+        "tasks": TASKS_FILE,
+        "data-model": DATA_MODEL_FILE,
+        "research": RESEARCH_FILE,
+        "contracts": API_CONTRACT_FILE,
+        "checklist": CHECKLIST_FILE,
+        "quickstart": QUICKSTART_FILE,
+    }
+
     def __init__(
         self,
         project_path: Path,
@@ -73,6 +86,11 @@ class FileStorage(StorageBase):
         super().__init__(project_path, specs_dir, base_dir)
         self._ensure_directories()
 
+        # Parsed constitution keyed by the file's (mtime_ns, size)
+        self._constitution_cache: tuple[tuple[int, int], Constitution] | None = None
+        # Feature IDs keyed by the specs directory's mtime_ns
+        self._features_cache: tuple[int, list[str]] | None = None
+
     def _ensure_directories(self) -> None:
         """Create necessary directories if they don't exist."""
         self.config_path.mkdir(parents=True, exist_ok=True)
@@ -97,23 +115,40 @@ class FileStorage(StorageBase):
     # Constitution
     # =========================================================================
 
+    @property
+    def constitution_path(self) -> Path:
+        """Get the path of the project constitution file."""
+        return self.config_path / self.CONSTITUTION_FILE
+
     def save_constitution(self, constitution: Constitution) -> Path:
         """Save project constitution to Markdown file."""
-        file_path = self.config_path / self.CONSTITUTION_FILE
+        file_path = self.constitution_path
         self._create_backup(file_path)
 
         content = constitution.to_markdown()
         file_path.write_text(content, encoding="utf-8")
+        # The file's mtime may not change within one timestamp tick
+        self._constitution_cache = None
         return file_path
 
     def load_constitution(self) -> Constitution | None:
-        """Load project constitution from Markdown file."""
-        file_path = self.config_path / self.CONSTITUTION_FILE
-        if not file_path.exists():
+        """
+        Load project constitution from Markdown file.
+
+        The parsed constitution is reused until the file's modification time
+        or size changes; callers receive their own copy.
+        """
+        try:
+            stat = os.stat(self.constitution_path)
+        except OSError:
             return None
 
-        content = file_path.read_text(encoding="utf-8")
-        return self._parse_constitution(content)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if self._constitution_cache is None or self._constitution_cache[0] != signature:
+            content = self.constitution_path.read_text(encoding="utf-8")
+            self._constitution_cache = (signature, self._parse_constitution(content))
+
+        return self._constitution_cache[1].model_copy(deep=True)
 
     def _parse_constitution(self, content: str) -> Constitution:
         """Parse Markdown content into Constitution model."""
@@ -165,8 +200,7 @@ class FileStorage(StorageBase):
 
     def save_specification(self, specification: Specification, feature_id: str) -> Path:
         """Save feature specification to Markdown file."""
-        feature_path = self.get_feature_path(feature_id)
-        feature_path.mkdir(parents=True, exist_ok=True)
+        feature_path = self.create_feature(feature_id)
 
         file_path = feature_path / self.SPEC_FILE
         self._create_backup(file_path)
@@ -228,8 +262,7 @@ class FileStorage(StorageBase):
 
     def save_plan(self, plan: TechnicalPlan, feature_id: str) -> Path:
         """Save technical plan to Markdown file."""
-        feature_path = self.get_feature_path(feature_id)
-        feature_path.mkdir(parents=True, exist_ok=True)
+        feature_path = self.create_feature(feature_id)
 
         file_path = feature_path / self.PLAN_FILE
         self._create_backup(file_path)
@@ -288,8 +321,7 @@ class FileStorage(StorageBase):
 
     def save_tasks(self, tasks: TaskBreakdown, feature_id: str) -> Path:
         """Save task breakdown to Markdown file."""
-        feature_path = self.get_feature_path(feature_id)
-        feature_path.mkdir(parents=True, exist_ok=True)
+        feature_path = self.create_feature(feature_id)
 
         file_path = feature_path / self.TASKS_FILE
         self._create_backup(file_path)
@@ -338,16 +370,28 @@ class FileStorage(StorageBase):
     # =========================================================================
 
     def list_features(self) -> list[str]:
-        """List all feature identifiers in the project."""
-        if not self.specs_path.exists():
+        """
+        List all feature identifiers in the project.
+
+        The directory listing is reused until the specs directory's
+        modification time changes, which happens whenever a feature directory
+        is created, removed or renamed.
+        """
+        try:
+            mtime_ns = os.stat(self.specs_path).st_mtime_ns
+        except OSError:
             return []
 
-        features = []
-        for path in self.specs_path.iterdir():
-            if path.is_dir() and not path.name.startswith("."):
-                features.append(path.name)
+        if self._features_cache is None or self._features_cache[0] != mtime_ns:
+            with os.scandir(self.specs_path) as entries:
+                features = sorted(
+                    entry.name
+                    for entry in entries
+                    if entry.is_dir() and not entry.name.startswith(".")
+                )
+            self._features_cache = (mtime_ns, features)
 
-        return sorted(features)
+        return list(self._features_cache[1])
 
     def feature_exists(self, feature_id: str) -> bool:
         """Check if a feature exists."""
@@ -362,6 +406,8 @@ class FileStorage(StorageBase):
         """Create a new feature directory."""
         feature_path = self.get_feature_path(feature_id)
         feature_path.mkdir(parents=True, exist_ok=True)
+        # Directory mtimes can be coarser than back-to-back creations
+        self._features_cache = None
         return feature_path
 
     # =========================================================================
@@ -435,26 +481,43 @@ class FileStorage(StorageBase):
         Returns:
             Path to the artifact file
         """
-        filenames = {
-            "spec": self.SPEC_FILE,
-            "plan": self.PLAN_FILE,
-            "tasks": self.TASKS_FILE,
-            "data-model": self.DATA_MODEL_FILE,
-            "research": self.RESEARCH_FILE,
-            "contracts": self.API_CONTRACT_FILE,
-            "checklist": self.CHECKLIST_FILE,
-            "quickstart": self.QUICKSTART_FILE,
-        }
-
-        if artifact_type not in filenames:
+        if artifact_type not in self.ARTIFACT_FILES:
             raise ValueError(f"Unknown artifact type: {artifact_type}")
 
-        return self.get_feature_path(feature_id) / filenames[artifact_type]
+        return self.get_feature_path(feature_id) / self.ARTIFACT_FILES[artifact_type]
 
     def artifact_exists(self, feature_id: str, artifact_type: str) -> bool:
         """Check if a specific artifact exists."""
         return self.get_artifact_path(feature_id, artifact_type).exists()
 
+    def list_artifacts(self, feature_id: str) -> set[str]:
+        """
+        Get the artifact types that exist for a feature.
+
+        Reads the feature directory once instead of checking every artifact
+        path separately; only artifacts stored in a subdirectory need an
+        extra check.
+
+        Args:
+            feature_id: Feature identifier
+
+        Returns:
+            Set of artifact types (keys of ARTIFACT_FILES) present on disk
+        """
+        feature_path = self.get_feature_path(feature_id)
+        try:
+            with os.scandir(feature_path) as entries:
+                names = {entry.name for entry in entries}
+        except OSError:
+            return set()
+
+        found = set()
+        for artifact_type, filename in self.ARTIFACT_FILES.items():
+            head, _, rest = filename.partition("/")
+            if head in names and (not rest or (feature_path / filename).exists()):
+                found.add(artifact_type)
+        return found
+
     # =========================================================================
     # Extended Artifacts (Data Model, Research, Contracts, Checklist, Quickstart)
     # =========================================================================
@@ -510,9 +573,9 @@ class FileStorage(StorageBase):
         Returns:
             Path to the saved file
         """
-        feature_path = self.get_feature_path(feature_id)
+        feature_path = self.create_feature(feature_id)
         contracts_dir = feature_path / "contracts"
-        contracts_dir.mkdir(parents=True, exist_ok=True)
+        contracts_dir.mkdir(exist_ok=True)
 
         file_path = feature_path / self.API_CONTRACT_FILE
         self._create_backup(file_path)
@@ -534,9 +597,9 @@ class FileStorage(StorageBase):
         Returns:
             Path to the saved file
         """
-        feature_path = self.get_feature_path(feature_id)
+        feature_path = self.create_feature(feature_id)
         checklists_dir = feature_path / "checklists"
-        checklists_dir.mkdir(parents=True, exist_ok=True)
+        checklists_dir.mkdir(exist_ok=True)
 
         file_path = feature_path / self.CHECKLIST_FILE
         self._create_backup(file_path)
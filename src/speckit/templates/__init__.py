@@ -12,12 +12,15 @@ from jinja2 import Environment, FileSystemLoader, select_autoescape
 # Template directory
 TEMPLATE_DIR = Path(__file__).parent
 
-# Jinja2 environment
+# Jinja2 environment. Templates ship with the package and never change at
+# runtime, so compiled templates are served from the environment's cache
+# without re-checking the source file's mtime on every render.
 _env = Environment(
     loader=FileSystemLoader(TEMPLATE_DIR),
     autoescape=select_autoescape(["html", "xml"]),
     trim_blocks=True,
     lstrip_blocks=True,
+    auto_reload=False,
 )
 
 
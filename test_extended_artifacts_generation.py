@@ -44,34 +44,42 @@ async def test_full_workflow():
     kit.save(plan)
     print(f"✓ Technical plan saved")
 
-    # Step 3: Generate Data Model
-    print("\n[3/7] Generating data model...")
-    data_model = await kit.generate_data_model_async(spec, plan)
-    kit.storage.save_data_model(data_model, spec.feature_id)
+    # Steps 3-7 only depend on (spec, plan), so generate them concurrently;
+    # kit.config.llm.max_concurrency bounds the simultaneous LLM requests
+    print("\n[3-7/7] Generating data model, research, API contract, checklist and quickstart...")
+    artifacts = await kit.generate_all_async(spec, plan)
+    data_model = artifacts.data_model
+    research = artifacts.research
+    contract = artifacts.api_contract
+    checklist = artifacts.checklist
+    quickstart = artifacts.quickstart
+
+    # The five files are independent, so write them on worker threads
+    # instead of blocking the event loop with one disk write after another
+    await asyncio.gather(
+        asyncio.to_thread(kit.storage.save_data_model, data_model, spec.feature_id),
+        asyncio.to_thread(kit.storage.save_research, research, spec.feature_id),
+        asyncio.to_thread(kit.storage.save_api_contract, contract, spec.feature_id),
+        asyncio.to_thread(kit.storage.save_checklist, checklist, spec.feature_id),
+        asyncio.to_thread(kit.storage.save_quickstart, quickstart, spec.feature_id),
+    )
+
+    # Step 3: Data Model
     print(f"✓ Data model saved: {len(data_model.entities)} entities")
     for entity in data_model.entities:
         print(f"  - {entity.name}: {len(entity.fields)} fields")
 
-    # Step 4: Generate Research Findings
-    print("\n[4/7] Generating research findings...")
-    research = await kit.generate_research_async(plan)
-    kit.storage.save_research(research, spec.feature_id)
+    # Step 4: Research Findings
     print(f"✓ Research saved: {len(research.decisions)} technology decisions")
     for decision in research.decisions:
         print(f"  - {decision.decision_name}: {decision.selected_option}")
 
-    # Step 5: Generate API Contract
-    print("\n[5/7] Generating API contract...")
-    contract = await kit.generate_api_contract_async(spec, plan)
-    kit.storage.save_api_contract(contract, spec.feature_id)
+    # Step 5: API Contract
     print(f"✓ API contract saved: {len(contract.endpoints)} endpoints")
     for endpoint in contract.endpoints:
         print(f"  - {endpoint.method} {endpoint.path}")
 
-    # Step 6: Generate Quality Checklist
-    print("\n[6/7] Generating quality checklist...")
-    checklist = await kit.generate_checklist_async(spec)
-    kit.storage.save_checklist(checklist, spec.feature_id)
+    # Step 6: Quality Checklist
     total_items = (
         len(checklist.content_quality)
         + len(checklist.requirement_completeness or [])
@@ -80,10 +88,7 @@ async def test_full_workflow():
     print(f"✓ Checklist saved: {total_items} validation items")
     print(f"  - Overall status: {checklist.overall_status}")
 
-    # Step 7: Generate Quickstart Guide
-    print("\n[7/7] Generating quickstart guide...")
-    quickstart = await kit.generate_quickstart_async(spec, plan)
-    kit.storage.save_quickstart(quickstart, spec.feature_id)
+    # Step 7: Quickstart Guide
     print(f"✓ Quickstart saved:")
     print(f"  - {len(quickstart.prerequisites)} prerequisites")
     print(f"  - {len(quickstart.installation_steps)} installation steps")
@@ -1,8 +1,6 @@
 """Shared test fixtures for speckit tests."""
 
-import tempfile
 from pathlib import Path
-from typing import Generator
 from unittest.mock import MagicMock, AsyncMock
 
 import pytest
@@ -11,17 +9,17 @@ from speckit.config import LLMConfig, StorageConfig, SpecKitConfig
 
 
 @pytest.fixture
-def temp_project_dir() -> Generator[Path, None, None]:
+def temp_project_dir(tmp_path: Path) -> Path:
     """Create a temporary project directory for testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        project_path = Path(tmpdir)
-        # Create .speckit directory
-        speckit_dir = project_path / ".speckit"
-        speckit_dir.mkdir()
-        # Create specs directory
-        specs_dir = project_path / "specs"
-        specs_dir.mkdir()
-        yield project_path
+    # tmp_path is a subdirectory of pytest's session-wide base temp directory
+    project_path = tmp_path
+    # Create .speckit directory
+    speckit_dir = project_path / ".speckit"
+    speckit_dir.mkdir()
+    # Create specs directory
+    specs_dir = project_path / "specs"
+    specs_dir.mkdir()
+    return project_path
 
 
 @pytest.fixture
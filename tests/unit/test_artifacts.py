@@ -0,0 +1,252 @@
+"""Unit tests for ArtifactGenerator."""
+
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from speckit.core.artifacts import _BATCH, ArtifactGenerator, ExtendedArtifacts
+from speckit.schemas import (
+    APIContract,
+    DataModel,
+    QuickstartGuide,
+    ResearchFindings,
+    Specification,
+    TechnicalPlan,
+    TechStack,
+)
+
+
+def _build_response(prompt, response_model, system=None, **kwargs):
+    """Return a minimal instance of the requested artifact model."""
+    return response_model(feature_id="llm-id", feature_name="LLM Name")
+
+
+@pytest.fixture
+def mock_llm():
+    """Create mock LLM provider returning minimal artifacts."""
+    mock = MagicMock()
+    mock.complete_structured.side_effect = _build_response
+    return mock
+
+
+@pytest.fixture
+def generator(mock_llm):
+    """Create artifact generator with mocked dependencies."""
+    return ArtifactGenerator(mock_llm, MagicMock())
+
+
+@pytest.fixture
+def specification():
+    """Create sample specification."""
+    return Specification(
+        feature_name="User Authentication",
+        feature_id="001-auth",
+        overview="Add user authentication.",
+        problem_statement="Users need to log in.",
+    )
+
+
+@pytest.fixture
+def plan():
+    """Create sample technical plan."""
+    return TechnicalPlan(
+        feature_id="001-auth",
+        tech_stack=TechStack(language="Python 3.11", framework="FastAPI"),
+        architecture_overview="Layered service.",
+    )
+
+
+class TestArtifactGeneration:
+    """Tests for individual generate_* methods."""
+
+    def test_generate_data_model_sets_ids(self, generator, specification, plan):
+        """Test that IDs come from the specification, not the LLM."""
+        data_model = generator.generate_data_model(specification, plan)
+
+        assert isinstance(data_model, DataModel)
+        assert data_model.feature_id == "001-auth"
+        assert data_model.feature_name == "User Authentication"
+
+    def test_generate_research_uses_plan_id(self, generator, plan):
+        """Test that plan-only artifacts take the feature ID from the plan."""
+        research = generator.generate_research(plan)
+
+        assert research.feature_id == "001-auth"
+        assert research.feature_name == "LLM Name"
+
+    async def test_generate_async(self, mock_llm, specification):
+        """Test the async path uses the async LLM call."""
+        mock_llm.complete_structured_async = AsyncMock(side_effect=_build_response)
+        generator = ArtifactGenerator(mock_llm, MagicMock())
+
+        checklist = await generator.generate_checklist_async(specification)
+
+        assert checklist.feature_id == "001-auth"
+        mock_llm.complete_structured_async.assert_awaited_once()
+        mock_llm.complete_structured.assert_not_called()
+
+    def test_generate_passes_language(self, generator, specification, plan):
+        """Test that language reaches the template."""
+        with patch("speckit.core.artifacts.render_template") as mock_render:
+            mock_render.return_value = "prompt"
+            generator.generate_api_contract(specification, plan, language="pt-br")
+
+        assert mock_render.call_args[0][0] == "api_contract.jinja2"
+        assert mock_render.call_args[1]["language"] == "pt-br"
+
+    def test_uses_slots(self, generator):
+        """Test that instances carry no per-instance __dict__."""
+        assert not hasattr(generator, "__dict__")
+
+
+class TestBatch:
+    """Tests for ArtifactGenerator.batch()."""
+
+    def test_batch_serializes_inputs_once(self, generator, specification, plan):
+        """Test that inputs are dumped once per batch."""
+        with (
+            patch.object(
+                Specification, "model_dump_json", autospec=True, side_effect=lambda *_, **__: "{}"
+            ) as spec_dump,
+            generator.batch(),
+        ):
+            generator.generate_data_model(specification, plan)
+            generator.generate_api_contract(specification, plan)
+            generator.generate_checklist(specification)
+
+        assert spec_dump.call_count == 1
+
+    def test_batch_shares_timestamp(self, generator, specification, plan):
+        """Test that artifacts in one batch share created_at."""
+        with generator.batch():
+            data_model = generator.generate_data_model(specification, plan)
+            contract = generator.generate_api_contract(specification, plan)
+
+        assert isinstance(contract, APIContract)
+        assert data_model.created_at == contract.created_at
+
+    def test_batch_state_cleared_on_exit(self, generator, specification, plan):
+        """Test that memoized state does not leak past the batch."""
+        with generator.batch():
+            with generator.batch():
+                generator.generate_data_model(specification, plan)
+            assert _BATCH.get() is not None
+
+        assert _BATCH.get() is None
+
+
+class TestGenerateAll:
+    """Tests for ArtifactGenerator.generate_all_async()."""
+
+    @pytest.fixture
+    def concurrency(self):
+        """Track in-flight and peak LLM calls."""
+        return {"active": 0, "peak": 0}
+
+    @pytest.fixture
+    def async_generator(self, mock_llm, concurrency):
+        """Create generator whose async LLM call records concurrency."""
+
+        async def complete(prompt, response_model, system=None, **kwargs):
+            concurrency["active"] += 1
+            concurrency["peak"] = max(concurrency["peak"], concurrency["active"])
+            await asyncio.sleep(0)
+            concurrency["active"] -= 1
+            return _build_response(prompt, response_model)
+
+        mock_llm.complete_structured_async = AsyncMock(side_effect=complete)
+        return ArtifactGenerator(mock_llm, MagicMock())
+
+    async def test_generates_all_artifacts(self, async_generator, concurrency, specification, plan):
+        """Test that all five artifacts are returned with shared metadata."""
+        result = await async_generator.generate_all_async(specification, plan)
+
+        assert isinstance(result, ExtendedArtifacts)
+        assert isinstance(result.data_model, DataModel)
+        assert isinstance(result.research, ResearchFindings)
+        assert isinstance(result.quickstart, QuickstartGuide)
+        assert result.checklist.feature_id == "001-auth"
+        assert result.data_model.created_at == result.quickstart.created_at
+        assert concurrency["peak"] == 5
+
+    async def test_max_concurrency(self, async_generator, concurrency, specification, plan):
+        """Test that max_concurrency bounds simultaneous LLM calls."""
+        await async_generator.generate_all_async(specification, plan, max_concurrency=2)
+
+        assert concurrency["peak"] == 2
+
+    async def test_failure_cancels_remaining(self, mock_llm, specification, plan):
+        """Test that one failing artifact cancels the other requests."""
+        started, finished = [], []
+
+        async def complete(prompt, response_model, system=None, **kwargs):
+            started.append(response_model)
+            if response_model is DataModel:
+                raise RuntimeError("data model failed")
+            await asyncio.sleep(0.05)
+            finished.append(response_model)
+            return _build_response(prompt, response_model)
+
+        mock_llm.complete_structured_async = AsyncMock(side_effect=complete)
+        generator = ArtifactGenerator(mock_llm, MagicMock())
+
+        with pytest.raises(RuntimeError, match="data model failed"):
+            await generator.generate_all_async(specification, plan, max_concurrency=2)
+        # Give leftover requests time to finish if they were not cancelled
+        await asyncio.sleep(0.1)
+
+        assert len(started) < 5
+        assert finished == []
+
+    async def test_concurrent_calls_keep_separate_batches(self, mock_llm, specification, plan):
+        """Test that concurrent generate_all_async calls do not share batch state."""
+
+        async def complete(prompt, response_model, system=None, **kwargs):
+            # The second feature's calls outlive the first call's batch
+            for _ in range(10 if "002-other" in prompt else 1):
+                await asyncio.sleep(0)
+            return _build_response(prompt, response_model)
+
+        mock_llm.complete_structured_async = AsyncMock(side_effect=complete)
+        generator = ArtifactGenerator(mock_llm, MagicMock())
+        other_spec = specification.model_copy(update={"feature_id": "002-other"})
+        other_plan = plan.model_copy(update={"feature_id": "002-other"})
+
+        with patch("speckit.core.artifacts.datetime") as mock_datetime:
+            mock_datetime.now.side_effect = [datetime(2025, 1, 1, second=i) for i in range(20)]
+            first, second = await asyncio.gather(
+                generator.generate_all_async(specification, plan, max_concurrency=5),
+                generator.generate_all_async(other_spec, other_plan, max_concurrency=5),
+            )
+
+        first_times = {artifact.created_at for artifact in vars(first).values()}
+        second_times = {artifact.created_at for artifact in vars(second).values()}
+        assert len(first_times) == len(second_times) == 1
+        assert first_times != second_times
+        assert _BATCH.get() is None
+
+    async def test_progress_labels_artifact_kind(self, mock_llm, specification, plan):
+        """Test that generate_all_async reports progress per artifact kind."""
+
+        async def complete(prompt, response_model, system=None, on_progress=None, **kwargs):
+            artifact = _build_response(prompt, response_model)
+            on_progress(artifact)
+            return artifact
+
+        mock_llm.complete_structured_async = AsyncMock(side_effect=complete)
+        generator = ArtifactGenerator(mock_llm, MagicMock())
+        kinds = []
+
+        await generator.generate_all_async(
+            specification, plan, on_progress=lambda kind, _partial: kinds.append(kind)
+        )
+
+        assert sorted(kinds) == [
+            "api_contract",
+            "checklist",
+            "data_model",
+            "quickstart",
+            "research",
+        ]
@@ -0,0 +1,290 @@
+"""Unit tests for the LLM response caches."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from speckit.cache import FileCacheBackend, LLMCache, MemoryCacheBackend, SemanticCache
+from speckit.config import LLMConfig
+from speckit.core.specification import SpecificationBuilder
+from speckit.llm import LiteLLMProvider
+from speckit.schemas import Specification
+
+
+def _mock_completion(content="Cached response"):
+    """Create a mock LiteLLM completion response."""
+    response = MagicMock()
+    response.choices = [MagicMock()]
+    response.choices[0].message.content = content
+    response.usage.prompt_tokens = 10
+    response.usage.completion_tokens = 5
+    response.usage.total_tokens = 15
+    return response
+
+
+@pytest.fixture
+def cache():
+    """Create in-memory LLM cache."""
+    return LLMCache(MemoryCacheBackend())
+
+
+@pytest.fixture
+def provider(cache):
+    """Create deterministic provider with a cache attached."""
+    return LiteLLMProvider(LLMConfig(model="gpt-4o-mini", temperature=0), cache=cache)
+
+
+class TestLLMCache:
+    """Tests for LLMCache."""
+
+    def test_miss_then_hit(self, cache):
+        """Test that stored values are returned for equal requests."""
+        request = {"model": "gpt-4o-mini", "messages": [{"role": "user", "content": "Hi"}]}
+
+        assert cache.get(request) is None
+        cache.set(request, {"content": "Hello"})
+
+        assert cache.get(dict(reversed(list(request.items())))) == {"content": "Hello"}
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+        assert cache.stats.hit_rate == 0.5
+
+    def test_ttl_expiry(self, cache):
+        """Test that expired entries are treated as misses."""
+        cache.ttl_seconds = 60
+        with patch("speckit.cache.time.time", return_value=1000.0):
+            cache.set({"q": 1}, "value")
+        with patch("speckit.cache.time.time", return_value=1061.0):
+            assert cache.get({"q": 1}) is None
+
+    @pytest.mark.parametrize(
+        ("entry", "ttl_seconds"),
+        [
+            ({}, None),
+            ([], None),
+            ([], 60),
+            ({"value": 1}, 60),
+            ({"created_at": "x", "value": 1}, 60),
+        ],
+    )
+    def test_malformed_entries_are_misses(self, entry, ttl_seconds):
+        """Test that entries with an unexpected shape are treated as misses."""
+        backend = MemoryCacheBackend()
+        cache = LLMCache(backend, ttl_seconds=ttl_seconds)
+        backend.set(cache.make_key({"q": 1}), entry)
+
+        assert cache.get({"q": 1}) is None
+        assert cache.stats.misses == 1
+
+    def test_file_backend_roundtrip(self, tmp_path):
+        """Test that the file backend persists entries across instances."""
+        FileCacheBackend(tmp_path / "cache").set("abc", {"value": 1})
+
+        assert FileCacheBackend(tmp_path / "cache").get("abc") == {"value": 1}
+        assert FileCacheBackend(tmp_path / "cache").get("missing") is None
+
+    def test_file_backend_ignored_by_git(self, tmp_path):
+        """Test that the cache directory is created with a catch-all .gitignore."""
+        FileCacheBackend(tmp_path / "cache").set("abc", {"value": 1})
+
+        assert (tmp_path / "cache" / ".gitignore").read_text() == "*\n"
+
+    def test_file_backend_unwritable(self, tmp_path):
+        """Test that an unusable cache directory degrades to misses."""
+        blocker = tmp_path / "not-a-dir"
+        blocker.write_text("")
+        backend = FileCacheBackend(blocker / "cache")
+
+        backend.set("abc", {"value": 1})
+
+        assert backend.get("abc") is None
+
+
+class TestProviderCaching:
+    """Tests for LiteLLMProvider cache integration."""
+
+    @patch("speckit.llm.litellm.completion")
+    def test_complete_cached(self, mock_completion, provider):
+        """Test that repeated deterministic completions hit the cache."""
+        mock_completion.return_value = _mock_completion()
+
+        first = provider.complete("Hello")
+        second = provider.complete("Hello")
+
+        assert second.content == first.content == "Cached response"
+        assert second.usage == first.usage
+        mock_completion.assert_called_once()
+
+    @patch("speckit.llm.litellm.completion")
+    def test_complete_ignores_malformed_entry(self, mock_completion, provider, cache):
+        """Test that a cached text payload missing its keys triggers a fresh call."""
+        mock_completion.return_value = _mock_completion()
+        request = provider._cache_request(
+            {**provider._get_completion_kwargs(), "messages": [{"role": "user", "content": "Hi"}]}
+        )
+        cache.set(request, {"content": "stale"})
+
+        response = provider.complete("Hi")
+
+        assert response.content == "Cached response"
+        mock_completion.assert_called_once()
+
+    @patch("speckit.llm.litellm.completion")
+    def test_nonzero_temperature_not_cached(self, mock_completion, cache):
+        """Test that sampled completions bypass the cache."""
+        provider = LiteLLMProvider(LLMConfig(temperature=0.7), cache=cache)
+        mock_completion.return_value = _mock_completion()
+
+        provider.complete("Hello")
+        provider.complete("Hello")
+
+        assert mock_completion.call_count == 2
+        assert cache.stats.hits == cache.stats.misses == 0
+
+    def test_structured_cached(self, provider):
+        """Test that structured outputs are revalidated from the cache."""
+        spec = Specification(feature_name="Auth", feature_id="001-auth")
+        provider._instructor_client = MagicMock()
+        provider._instructor_client.create.return_value = spec
+
+        provider.complete_structured("Specify auth", Specification)
+        cached = provider.complete_structured("Specify auth", Specification)
+
+        assert isinstance(cached, Specification)
+        assert cached.feature_id == "001-auth"
+        provider._instructor_client.create.assert_called_once()
+
+    async def test_cache_write_failure_keeps_result(self, tmp_path):
+        """Test that a failing cache write neither discards the result nor falls back."""
+        blocker = tmp_path / "not-a-dir"
+        blocker.write_text("")
+        provider = LiteLLMProvider(
+            LLMConfig(model="gpt-4o-mini", temperature=0),
+            cache=LLMCache(FileCacheBackend(blocker / "cache")),
+        )
+        spec = Specification(feature_name="Auth", feature_id="001-auth")
+        provider._async_instructor_client = MagicMock()
+        provider._async_instructor_client.create = AsyncMock(return_value=spec)
+
+        result = await provider.complete_structured_async("Specify auth", Specification)
+
+        assert result is spec
+        provider._async_instructor_client.create.assert_awaited_once()
+
+
+class TestSemanticCache:
+    """Tests for SemanticCache."""
+
+    def test_exact_match_ignores_case_and_whitespace(self):
+        """Test that normalized text matches without an embedding."""
+        cache = SemanticCache()
+        cache.add("Add  JWT auth", [1.0, 0.0], "scope", {"v": 1})
+
+        assert cache.get_exact("add jwt AUTH", "scope") == {"v": 1}
+        assert cache.get_exact("add jwt auth", "other-scope") is None
+
+    def test_similarity_threshold(self):
+        """Test that only vectors above the threshold match."""
+        cache = SemanticCache(threshold=0.9)
+        cache.add("Add JWT auth", [1.0, 0.0], "scope", {"v": 1})
+
+        assert cache.get_similar([0.99, 0.05], "scope") == {"v": 1}
+        assert cache.get_similar([0.5, 0.5], "scope") is None
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+
+    def test_persistence(self, tmp_path):
+        """Test that entries are reloaded from the cache file."""
+        path = tmp_path / "cache" / "specifications.json"
+        SemanticCache(path=path).add("Add JWT auth", [3.0, 4.0], "scope", {"v": 1})
+
+        assert SemanticCache(path=path).get_similar([0.6, 0.8], "scope") == {"v": 1}
+
+    def test_unwritable_path_keeps_entries_in_memory(self, tmp_path):
+        """Test that a failing write leaves the entry usable for this process."""
+        blocker = tmp_path / "not-a-dir"
+        blocker.write_text("")
+        cache = SemanticCache(path=blocker / "specifications.json")
+
+        cache.add("Add JWT auth", [1.0, 0.0], "scope", {"v": 1})
+
+        assert cache.get_exact("Add JWT auth", "scope") == {"v": 1}
+
+    def test_malformed_file_is_ignored(self, tmp_path):
+        """Test that unexpected file contents are treated as an empty cache."""
+        path = tmp_path / "specifications.json"
+        path.write_text('[{"scope": "scope"}, 3]')
+
+        assert SemanticCache(path=path).get_exact("Add JWT auth", "scope") is None
+
+
+class TestSpecificationBuilderSemanticCache:
+    """Tests for SpecificationBuilder with a semantic cache."""
+
+    @pytest.fixture
+    def mock_llm(self):
+        """Create mock LLM returning a fixed specification and embedding."""
+        mock = MagicMock()
+        mock.config = LLMConfig(model="gpt-4o-mini")
+        mock.complete_structured.return_value = Specification(
+            feature_name="Auth", feature_id="llm-id", overview="JWT auth."
+        )
+        mock.embed.return_value = [1.0, 0.0]
+        return mock
+
+    @pytest.fixture
+    def builder(self, mock_llm):
+        """Create builder with an in-memory semantic cache."""
+        storage = MagicMock()
+        storage.list_features.return_value = []
+        return SpecificationBuilder(mock_llm, storage, semantic_cache=SemanticCache())
+
+    def test_similar_description_reuses_spec(self, builder, mock_llm):
+        """Test that a similar description skips the LLM call."""
+        builder.generate("Add JWT authentication", feature_id="001-auth")
+        mock_llm.embed.return_value = [0.98, 0.1]
+
+        spec = builder.generate("Add authentication using JWT", feature_id="002-auth")
+
+        assert spec.feature_id == "002-auth"
+        assert spec.overview == "JWT auth."
+        mock_llm.complete_structured.assert_called_once()
+
+    def test_exact_description_skips_embedding(self, builder, mock_llm):
+        """Test that a repeated description needs no embedding call."""
+        builder.generate("Add JWT authentication", feature_id="001-auth")
+        builder.generate("add jwt authentication", feature_id="002-auth")
+
+        mock_llm.embed.assert_called_once()
+        mock_llm.complete_structured.assert_called_once()
+
+    def test_language_scopes_entries(self, builder, mock_llm):
+        """Test that specifications are not reused across languages."""
+        builder.generate("Add JWT authentication", feature_id="001-auth")
+        builder.generate("Add JWT authentication", feature_id="002-auth", language="pt-br")
+
+        assert mock_llm.complete_structured.call_count == 2
+
+    def test_cache_write_failure_returns_spec(self, mock_llm, tmp_path):
+        """Test that a spec is returned even if the cache file cannot be written."""
+        blocker = tmp_path / "not-a-dir"
+        blocker.write_text("")
+        storage = MagicMock()
+        storage.list_features.return_value = []
+        builder = SpecificationBuilder(
+            mock_llm, storage, semantic_cache=SemanticCache(path=blocker / "specs.json")
+        )
+
+        spec = builder.generate("Add JWT authentication", feature_id="001-auth")
+
+        assert spec.feature_id == "001-auth"
+        mock_llm.complete_structured.assert_called_once()
+
+    def test_embedding_failure_generates(self, builder, mock_llm):
+        """Test that an embedding error falls back to plain generation."""
+        mock_llm.embed.side_effect = RuntimeError("no embedding model")
+
+        spec = builder.generate("Add JWT authentication", feature_id="001-auth")
+
+        assert spec.feature_id == "001-auth"
+        mock_llm.complete_structured.assert_called_once()
@@ -0,0 +1,56 @@
+"""Unit tests for configuration loading."""
+
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from speckit.config import SpecKitConfig
+
+
+@pytest.fixture
+def config_file(temp_project_dir):
+    """Create a project config file."""
+    path = temp_project_dir / ".speckit" / "config.yaml"
+    path.write_text("llm:\n  model: gpt-4o\nlanguage: pt-br\n")
+    return path
+
+
+class TestFromProject:
+    """Tests for SpecKitConfig.from_project()."""
+
+    def test_loads_config_file(self, temp_project_dir, config_file):
+        """Test that values come from .speckit/config.yaml."""
+        config = SpecKitConfig.from_project(temp_project_dir)
+
+        assert config.llm.model == "gpt-4o"
+        assert config.language == "pt-br"
+        assert config.project_path == temp_project_dir.resolve()
+
+    def test_memoized_until_file_changes(self, temp_project_dir, config_file):
+        """Test that the file is parsed once until it is rewritten."""
+        with patch("speckit.config.yaml.safe_load", wraps=yaml.safe_load) as load:
+            first = SpecKitConfig.from_project(temp_project_dir)
+            second = SpecKitConfig.from_project(temp_project_dir)
+            assert load.call_count == 1
+
+            config_file.write_text("llm:\n  model: gpt-4o-mini\nlanguage: es\n")
+            third = SpecKitConfig.from_project(temp_project_dir)
+
+        assert load.call_count == 2
+        assert second.llm.model == "gpt-4o"
+        assert third.language == "es"
+        assert first is not second
+
+    def test_returns_independent_copies(self, temp_project_dir, config_file):
+        """Test that mutating a returned config does not leak into the cache."""
+        SpecKitConfig.from_project(temp_project_dir).llm.model = "changed"
+
+        assert SpecKitConfig.from_project(temp_project_dir).llm.model == "gpt-4o"
+
+    def test_environment_change_invalidates(self, temp_project_dir, config_file, monkeypatch):
+        """Test that SPECKIT_* environment changes are picked up."""
+        SpecKitConfig.from_project(temp_project_dir)
+        monkeypatch.setenv("SPECKIT_VERBOSE", "true")
+
+        assert SpecKitConfig.from_project(temp_project_dir).verbose is True
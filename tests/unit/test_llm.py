@@ -58,6 +58,7 @@ class TestLiteLLMProvider:
         """Test provider initialization."""
         assert provider.config == llm_config
         assert provider._instructor_client is None
+        assert provider._async_instructor_client is None
 
     def test_get_completion_kwargs(self, provider):
         """Test building completion kwargs."""
@@ -124,6 +125,33 @@ class TestLiteLLMProvider:
         assert messages[0]["role"] == "system"
         assert messages[1]["role"] == "user"
 
+    @patch("speckit.llm.litellm.completion")
+    def test_complete_anthropic_prompt_caching(self, mock_completion):
+        """Test that Anthropic models get a cacheable system prompt block."""
+        provider = LiteLLMProvider(LLMConfig(model="claude-3-haiku-20240307"))
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.content = "Response"
+        mock_completion.return_value = mock_response
+
+        provider.complete("Hello", system="You are helpful")
+
+        system = mock_completion.call_args[1]["messages"][0]
+        assert system["role"] == "system"
+        assert system["content"] == [
+            {
+                "type": "text",
+                "text": "You are helpful",
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
+
+    def test_prompt_caching_other_providers(self, provider):
+        """Test that non-Anthropic models keep plain system messages."""
+        messages = [{"role": "system", "content": "Sys"}, {"role": "user", "content": "Hi"}]
+
+        assert provider._with_prompt_caching(messages, "gpt-4o-mini") is messages
+
     @patch("speckit.llm.litellm.completion")
     def test_complete_fallback_on_error(self, mock_completion, provider):
         """Test fallback to secondary model on error."""
@@ -170,6 +198,118 @@ class TestLiteLLMProvider:
 
         assert response.content == "Async response"
 
+    @pytest.mark.asyncio
+    @patch("instructor.from_litellm")
+    async def test_complete_structured_async_reuses_client(self, mock_from_litellm, provider):
+        """Test that the async instructor client is created once."""
+        mock_client = MagicMock()
+        mock_client.create = AsyncMock(return_value=LLMResponse(content="", model="m"))
+        mock_from_litellm.return_value = mock_client
+
+        await provider.complete_structured_async("Hello", LLMResponse)
+        await provider.complete_structured_async("Again", LLMResponse)
+
+        mock_from_litellm.assert_called_once()
+        assert mock_client.create.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_complete_structured_async_progress(self, provider):
+        """Test that partial objects are reported and the final one validated."""
+        from speckit.schemas import Specification
+
+        partials = [
+            Specification.model_construct(feature_name="Auth", feature_id=None),
+            Specification.model_construct(feature_name="Auth", feature_id="001-auth"),
+        ]
+
+        async def create_partial(**kwargs):
+            for partial in partials:
+                yield partial
+
+        provider._async_instructor_client = MagicMock()
+        provider._async_instructor_client.create_partial = create_partial
+        seen = []
+
+        result = await provider.complete_structured_async(
+            "Specify auth", Specification, on_progress=seen.append
+        )
+
+        assert seen == partials
+        assert isinstance(result, Specification)
+        assert result.feature_id == "001-auth"
+        provider._async_instructor_client.create.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_complete_structured_async_progress_error(self, provider):
+        """Test that callback errors propagate without trying fallback models."""
+        from speckit.schemas import Specification
+
+        calls = []
+
+        async def create_partial(**kwargs):
+            calls.append(kwargs["model"])
+            yield Specification.model_construct(feature_name="Auth")
+
+        def on_progress(partial):
+            raise RuntimeError("display closed")
+
+        provider._async_instructor_client = MagicMock()
+        provider._async_instructor_client.create_partial = create_partial
+
+        with pytest.raises(RuntimeError, match="display closed"):
+            await provider.complete_structured_async(
+                "Specify auth", Specification, on_progress=on_progress
+            )
+
+        assert calls == ["gpt-4o-mini"]
+
+    @pytest.mark.asyncio
+    async def test_complete_structured_async_progress_no_fallback_midstream(self, provider):
+        """Test that a stream failing after partials were delivered is not retried."""
+        from speckit.schemas import Specification
+
+        calls = []
+
+        async def create_partial(**kwargs):
+            calls.append(kwargs["model"])
+            yield Specification.model_construct(feature_name="Auth")
+            raise ConnectionError("stream dropped")
+
+        provider._async_instructor_client = MagicMock()
+        provider._async_instructor_client.create_partial = create_partial
+        seen = []
+
+        with pytest.raises(ConnectionError):
+            await provider.complete_structured_async(
+                "Specify auth", Specification, on_progress=seen.append
+            )
+
+        assert calls == ["gpt-4o-mini"]
+        assert len(seen) == 1
+
+    @pytest.mark.asyncio
+    async def test_complete_structured_async_progress_falls_back_before_output(self, provider):
+        """Test that a stream failing before any partial falls back to the next model."""
+        from speckit.schemas import Specification
+
+        async def create_partial(**kwargs):
+            if kwargs["model"] == "gpt-4o-mini" and not calls:
+                calls.append(kwargs["model"])
+                raise ConnectionError("refused")
+            calls.append(kwargs["model"])
+            yield Specification.model_construct(feature_name="Auth", feature_id="001-auth")
+
+        calls = []
+        provider._async_instructor_client = MagicMock()
+        provider._async_instructor_client.create_partial = create_partial
+
+        result = await provider.complete_structured_async(
+            "Specify auth", Specification, on_progress=lambda _partial: None
+        )
+
+        assert result.feature_id == "001-auth"
+        assert len(calls) == 2
+
     @patch("speckit.llm.litellm.completion")
     def test_stream(self, mock_completion, provider):
         """Test streaming completion."""
@@ -0,0 +1,77 @@
+"""Unit tests for the SpecKit orchestrator."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from speckit import SpecKit
+from speckit.schemas import Constitution, Specification, TechnicalPlan, TechStack
+
+
+@pytest.fixture
+def kit(speckit_config, temp_project_dir):
+    """Create SpecKit instance for a temporary project."""
+    return SpecKit(temp_project_dir, config=speckit_config)
+
+
+class TestSave:
+    """Tests for SpecKit.save()."""
+
+    def test_save_constitution(self, kit):
+        """Test that constitutions are saved at project level."""
+        path = kit.save(Constitution(project_name="Test"))
+
+        assert path == kit.storage.config_path / kit.storage.CONSTITUTION_FILE
+
+    def test_save_uses_artifact_feature_id(self, kit):
+        """Test that per-feature artifacts default to their own feature ID."""
+        path = kit.save(Specification(feature_name="Auth", feature_id="001-auth"))
+
+        assert path.parent.name == "001-auth"
+        assert kit.load_specification("001-auth") is not None
+
+    def test_save_feature_id_override(self, kit):
+        """Test that an explicit feature ID takes precedence."""
+        plan = TechnicalPlan(
+            feature_id="001-auth",
+            tech_stack=TechStack(language="Python 3.11"),
+            architecture_overview="Layered service.",
+        )
+        kit.save(plan, feature_id="002-other")
+
+        assert kit.load_plan("002-other") is not None
+
+    def test_save_subclass(self, kit):
+        """Test that subclasses of artifact models are dispatched."""
+
+        class CustomSpecification(Specification):
+            pass
+
+        kit.save(CustomSpecification(feature_name="Auth", feature_id="001-auth"))
+
+        assert kit.storage.artifact_exists("001-auth", "spec")
+
+    def test_save_unknown_type(self, kit):
+        """Test that unsupported objects raise TypeError."""
+        with pytest.raises(TypeError):
+            kit.save("not an artifact")
+
+
+class TestGenerateAll:
+    """Tests for SpecKit.generate_all_async()."""
+
+    async def test_delegates_with_config(self, kit):
+        """Test that language and max_concurrency come from the config."""
+        kit.config.language = "pt-br"
+        kit.config.llm.max_concurrency = 3
+        kit._artifact_generator = MagicMock()
+        kit._artifact_generator.generate_all_async = AsyncMock(return_value="artifacts")
+        spec = MagicMock()
+        plan = MagicMock()
+
+        result = await kit.generate_all_async(spec, plan)
+
+        assert result == "artifacts"
+        kit._artifact_generator.generate_all_async.assert_awaited_once_with(
+            specification=spec, plan=plan, language="pt-br", max_concurrency=3, on_progress=None
+        )
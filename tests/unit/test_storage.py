@@ -1,11 +1,14 @@
 """Unit tests for FileStorage."""
 
+import os
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from speckit.schemas import (
+    APIContract,
     Constitution,
     Specification,
     TechnicalPlan,
@@ -53,6 +56,14 @@ class TestFileStorageInit:
         assert (temp_project / ".config").exists()
         assert (temp_project / "features").exists()
 
+    def test_paths_follow_directory_names(self, storage, temp_project):
+        """Test that specs_path and config_path reflect the current directory names."""
+        storage.specs_dir = "features"
+        storage.base_dir = ".config"
+
+        assert storage.specs_path == temp_project / "features"
+        assert storage.config_path == temp_project / ".config"
+
 
 class TestConstitutionStorage:
     """Tests for Constitution storage."""
@@ -88,6 +99,44 @@ class TestConstitutionStorage:
         assert "Principle 1" in loaded.core_principles
         assert "Principle 2" in loaded.core_principles
 
+    def test_load_constitution_cached(self, storage, constitution):
+        """Test that an unchanged constitution is parsed once."""
+        storage.save_constitution(constitution)
+
+        with patch.object(
+            storage, "_parse_constitution", wraps=storage._parse_constitution
+        ) as mock_parse:
+            first = storage.load_constitution()
+            second = storage.load_constitution()
+
+        assert mock_parse.call_count == 1
+        assert first == second
+        assert first is not second
+
+    def test_load_constitution_reloads_on_change(self, storage, constitution):
+        """Test that rewriting the constitution invalidates the cache."""
+        storage.save_constitution(constitution)
+        storage.load_constitution()
+
+        constitution.project_name = "Renamed Project"
+        storage.save_constitution(constitution)
+
+        assert storage.load_constitution().project_name == "Renamed Project"
+
+    def test_load_constitution_after_same_size_save(self, storage, constitution):
+        """Test that saving refreshes the cache even if mtime and size are unchanged."""
+        storage.save_constitution(constitution)
+        storage.load_constitution()
+        stat = os.stat(storage.constitution_path)
+
+        constitution.project_name = constitution.project_name.upper()
+        storage.save_constitution(constitution)
+        # Simulate a rewrite within the same timestamp tick
+        os.utime(storage.constitution_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert os.stat(storage.constitution_path).st_size == stat.st_size
+        assert storage.load_constitution().project_name == constitution.project_name
+
     def test_load_nonexistent_constitution(self, storage):
         """Test loading when no constitution exists."""
         loaded = storage.load_constitution()
@@ -278,6 +327,40 @@ class TestFeatureManagement:
         assert "002-payments" in features
         assert len(features) == 2
 
+    def test_list_features_cached(self, storage):
+        """Test that the listing is reused until the specs directory changes."""
+        storage.create_feature("001-auth")
+        storage.list_features()
+
+        with patch("speckit.storage.file_storage.os.scandir") as mock_scandir:
+            assert storage.list_features() == ["001-auth"]
+        mock_scandir.assert_not_called()
+
+    def test_list_features_sees_new_features(self, storage):
+        """Test that saved and externally created features invalidate the listing."""
+        storage.create_feature("001-auth")
+        storage.list_features()
+
+        spec = Specification(feature_name="Payments", feature_id="002-payments")
+        storage.save_specification(spec, "002-payments")
+        assert storage.list_features() == ["001-auth", "002-payments"]
+
+        (storage.specs_path / "003-external").mkdir()
+        os.utime(storage.specs_path, ns=(0, 1))
+        assert storage.list_features() == ["001-auth", "002-payments", "003-external"]
+
+    def test_list_features_sees_contract_only_feature(self, storage):
+        """Test that saving a contract for a new feature invalidates the listing."""
+        storage.list_features()
+        mtime_ns = os.stat(storage.specs_path).st_mtime_ns
+
+        contract = APIContract(feature_id="001-api", feature_name="API")
+        storage.save_api_contract(contract, "001-api")
+        # Simulate a timestamp too coarse to register the new directory
+        os.utime(storage.specs_path, ns=(mtime_ns, mtime_ns))
+
+        assert storage.list_features() == ["001-api"]
+
     def test_feature_exists(self, storage):
         """Test checking feature existence."""
         storage.create_feature("001-test")
@@ -323,3 +406,14 @@ class TestFeatureManagement:
 
         assert storage.artifact_exists("001-test", "spec")
         assert not storage.artifact_exists("001-test", "plan")
+
+    def test_list_artifacts(self, storage):
+        """Test listing existing artifacts with a single directory scan."""
+        spec = Specification(
+            feature_name="Test",
+            feature_id="001-test",
+        )
+        storage.save_specification(spec, "001-test")
+
+        assert storage.list_artifacts("001-test") == {"spec"}
+        assert storage.list_artifacts("999-missing") == set()